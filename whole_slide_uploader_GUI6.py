@@ -28,20 +28,59 @@ Optional .env values:
     GITHUB_API_VERSION=2026-03-10
     THUMB_MAX_PX=1000
     THUMB_TARGET_KB=500
+    GALLERY_ATLAS=1
+    VIEWER_SELF_HOST=1
+    VIEWER_TILE_CACHE_MIB=200
     PAGES_VERIFY_TIMEOUT=300
     PAGES_SAFE_LIMIT_MIB=950
+    DEEPZOOM_PROFILE=standard
+    DEEPZOOM_PROFILE_CUSTOM=format=webp,quality=65,tile_size=510,overlap=1,subsample=auto,depth=onepixel
+    TISSUE_DETECTION=1
+    TISSUE_WHITE_LEVEL=220
+    TISSUE_MARGIN_PX=256
+    NATIVE_PYRAMID=1
+    NATIVE_PYRAMID_MAX_UPSAMPLE=1
+    DEEPZOOM_WORKERS=1
+    DEEPZOOM_WORKER_MEMORY_MIB=0
+    DEEPZOOM_WORKER_THREADS=0
+    DEEPZOOM_TIMEOUT=0
+    GIT_STREAM_TILES=1
+    PUSH_CHUNK_MIB=200
+    GIT_PAYLOAD_PROFILE=1
+    API_CACHE=1
+    API_CACHE_MAX_MIB=64
+    API_REQUESTS_PER_SECOND=5
+    API_BURST=10
+    API_BACKGROUND_RESERVE=500
+    FANOUT_WORKERS=8
+    PIPELINE_CONVERT_WORKERS=1
+    PIPELINE_PUSH_WORKERS=1
+    PIPELINE_VERIFY_WORKERS=4
+    CLEANUP_TREE_VERIFY=1
+    PAGES_TILE_CONFIDENCE=0.99
+    PAGES_TILE_MISSING_PERCENT=1
+    PAGES_TILE_WORKERS=16
+    CDN_WARMUP_TILES=200
+    CDN_WARMUP_WORKERS=8
+    PIPELINE_QUEUE_SIZE=2
 """
 
 from __future__ import annotations
 
 import argparse
 import base64
-import gc
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
 import html
 import json
 import logging
+import math
+import multiprocessing
 import os
 import queue
+import random
 import re
 import shutil
 import stat
@@ -50,10 +89,12 @@ import sys
 import tempfile
 import threading
 import time
+import unicodedata
 import webbrowser
+import xml.etree.ElementTree as ElementTree
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 APP_VERSION = "2026.08.19-GUI6"
 
@@ -73,7 +114,16 @@ INBOX_DIR = BASE_DIR / "y\u00fcklenecek"
 DONE_DIR = BASE_DIR / "y\u00fcklenen"
 LOG_PATH = BASE_DIR / "uploader.log"
 UI_SETTINGS_PATH = BASE_DIR / ".uploader-ui.json"
+API_CACHE_DIR = BASE_DIR / ".github-cache"
+GALLERY_MANIFEST_NAME = "gallery.json"
+GALLERY_MANIFEST_MIRROR = BASE_DIR / ".gallery-manifest.json"
+SEARCH_INDEX_NAME = "search-index.json"
+SEARCH_SCRIPT_NAME = "search.js"
+SEARCH_CACHE_PATH = BASE_DIR / ".gallery-search-cache.json"
+ATLAS_CACHE_DIR = BASE_DIR / ".gallery-atlas"
+VIEWER_ASSET_DIR = BASE_DIR / ".viewer-assets"
 MARKER_NAME = ".uploader-source.json"
+MANIFEST_DIR_NAME = ".deepzoom-manifest"
 META_SUFFIX = ".upload.json"
 
 os.environ.setdefault("VIPS_WARNING", "0")
@@ -104,9 +154,66 @@ REPO_PREFIX = os.getenv("REPO_PREFIX", "gallery-").strip() or "gallery-"
 REPO_DIGITS = max(1, int(os.getenv("REPO_DIGITS", "3")))
 GITHUB_API_VERSION = os.getenv("GITHUB_API_VERSION", "2026-03-10").strip() or "2026-03-10"
 THUMB_MAX_PX = max(300, int(os.getenv("THUMB_MAX_PX", "1000")))
+THUMB_VARIANT_WIDTHS = (240, 480)
+GALLERY_PAGE_SIZE = 24
+GALLERY_ATLAS = os.getenv("GALLERY_ATLAS", "1").strip().lower() not in {"0", "false", "no", "off"}
+ATLAS_CELL = (320, 240)  # gallery.css gives .thumb the same 4:3 aspect ratio
+ATLAS_COLUMNS = 6
+VIEWER_SELF_HOST = os.getenv("VIEWER_SELF_HOST", "1").strip().lower() not in {"0", "false", "no", "off"}
+VIEWER_TILE_CACHE_BYTES = max(0, int(os.getenv("VIEWER_TILE_CACHE_MIB", "200"))) * 1024 * 1024
+OSD_VERSION = "4.1.0"
+OSD_CDN_BASE = f"https://cdnjs.cloudflare.com/ajax/libs/openseadragon/{OSD_VERSION}/"
+OSD_ASSET_PATH = f"viewer/openseadragon-{OSD_VERSION}"
+OSD_BUTTON_IMAGES = tuple(
+    f"images/{button}_{state}.png"
+    for button in ("zoomin", "zoomout", "home", "fullpage")
+    for state in ("rest", "grouphover", "hover", "pressed")
+)
 THUMB_TARGET_BYTES = max(100, int(os.getenv("THUMB_TARGET_KB", "500"))) * 1024
 PAGES_VERIFY_TIMEOUT = max(60, int(os.getenv("PAGES_VERIFY_TIMEOUT", "300")))
 PAGES_SAFE_LIMIT_BYTES = max(100, int(os.getenv("PAGES_SAFE_LIMIT_MIB", "950"))) * 1024 * 1024
+DEEPZOOM_PROFILE = os.getenv("DEEPZOOM_PROFILE", "standard").strip().lower() or "standard"
+DEEPZOOM_PROFILE_CUSTOM = os.getenv("DEEPZOOM_PROFILE_CUSTOM", "").strip()
+TISSUE_DETECTION = os.getenv("TISSUE_DETECTION", "1").strip().lower() not in {"0", "false", "no", "off"}
+TISSUE_WHITE_LEVEL = min(254, max(150, int(os.getenv("TISSUE_WHITE_LEVEL", "220"))))
+TISSUE_MARGIN_PX = max(0, int(os.getenv("TISSUE_MARGIN_PX", "256")))
+NATIVE_PYRAMID = os.getenv("NATIVE_PYRAMID", "1").strip().lower() not in {"0", "false", "no", "off"}
+NATIVE_PYRAMID_MAX_UPSAMPLE = max(1.0, float(os.getenv("NATIVE_PYRAMID_MAX_UPSAMPLE", "1")))
+DEEPZOOM_WORKERS = max(1, int(os.getenv("DEEPZOOM_WORKERS", "1")))
+DEEPZOOM_WORKER_MEMORY_BYTES = max(0, int(os.getenv("DEEPZOOM_WORKER_MEMORY_MIB", "0"))) * 1024 * 1024
+DEEPZOOM_WORKER_THREADS = max(0, int(os.getenv("DEEPZOOM_WORKER_THREADS", "0")))
+DEEPZOOM_TIMEOUT = max(0, int(os.getenv("DEEPZOOM_TIMEOUT", "0")))
+GIT_STREAM_TILES = os.getenv("GIT_STREAM_TILES", "1").strip().lower() not in {"0", "false", "no", "off"}
+PUSH_CHUNK_BYTES = max(0, int(os.getenv("PUSH_CHUNK_MIB", "200"))) * 1024 * 1024
+# Chunks of a slide whose branch is already published go to this side branch,
+# so Pages only ever builds the finished commit.
+PUSH_CHUNK_BRANCH = "upload-tmp"
+GIT_PAYLOAD_PROFILE = os.getenv("GIT_PAYLOAD_PROFILE", "1").strip().lower() not in {"0", "false", "no", "off"}
+API_CACHE = os.getenv("API_CACHE", "1").strip().lower() not in {"0", "false", "no", "off"}
+API_CACHE_MAX_BYTES = max(0, int(os.getenv("API_CACHE_MAX_MIB", "64"))) * 1024 * 1024
+API_REQUESTS_PER_SECOND = max(0.1, float(os.getenv("API_REQUESTS_PER_SECOND", "5")))
+API_BURST = max(1, int(os.getenv("API_BURST", "10")))
+API_BACKGROUND_RESERVE = max(0, int(os.getenv("API_BACKGROUND_RESERVE", "500")))
+FANOUT_WORKERS = max(1, int(os.getenv("FANOUT_WORKERS", "8")))
+PIPELINE_CONVERT_WORKERS = max(1, int(os.getenv("PIPELINE_CONVERT_WORKERS", str(DEEPZOOM_WORKERS))))
+PIPELINE_PUSH_WORKERS = max(1, int(os.getenv("PIPELINE_PUSH_WORKERS", "1")))
+PIPELINE_VERIFY_WORKERS = max(1, int(os.getenv("PIPELINE_VERIFY_WORKERS", "4")))
+# Tiles HEAD-probed per level so that a level missing at least
+# PAGES_TILE_MISSING_PERCENT of its tiles is caught with the given confidence:
+# n = ceil(ln(1 - c) / ln(1 - p)). Smaller levels are checked in full.
+PAGES_TILE_CONFIDENCE = min(0.9999, max(0.0, float(os.getenv("PAGES_TILE_CONFIDENCE", "0.99"))))
+PAGES_TILE_MISSING = min(0.5, max(0.001, float(os.getenv("PAGES_TILE_MISSING_PERCENT", "1")) / 100))
+PAGES_TILE_SAMPLE = (
+    math.ceil(math.log(1 - PAGES_TILE_CONFIDENCE) / math.log(1 - PAGES_TILE_MISSING)) if PAGES_TILE_CONFIDENCE else 0
+)
+PAGES_TILE_WORKERS = max(1, int(os.getenv("PAGES_TILE_WORKERS", "16")))
+# Cleanup scans only spot-check repos whose full sample has not passed yet;
+# the full sample runs when a repo is actually deleted.
+CLEANUP_SCAN_TILE_SAMPLE = min(PAGES_TILE_SAMPLE, 16)
+CLEANUP_TREE_VERIFY = os.getenv("CLEANUP_TREE_VERIFY", "1").strip().lower() not in {"0", "false", "no", "off"}
+CDN_WARMUP_TILES = max(0, int(os.getenv("CDN_WARMUP_TILES", "200")))
+CDN_WARMUP_WORKERS = max(1, int(os.getenv("CDN_WARMUP_WORKERS", "8")))
+PIPELINE_QUEUE_SIZE = max(1, int(os.getenv("PIPELINE_QUEUE_SIZE", "2")))
 
 _repo_base_raw = os.getenv("LOCAL_REPO_BASE", "repos").strip() or "repos"
 LOCAL_REPO_BASE = Path(_repo_base_raw)
@@ -215,6 +322,265 @@ def _response_message(response: requests.Response) -> str:
     return response.text[:500]
 
 
+class ApiScheduler:
+    """Shares one GitHub API budget between all threads.
+
+    A token bucket paces requests, the X-RateLimit headers keep the local
+    count in line with GitHub's, background scans leave a reserve for upload
+    calls, and repeated failures or a secondary rate limit open a circuit
+    that pauses every thread instead of letting each one retry on its own.
+    """
+
+    WRITE_INTERVAL = 1.0
+    FAILURE_THRESHOLD = 3
+
+    def __init__(self, rate: float, burst: int, reserve: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.reserve = reserve
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.open_until = 0.0
+        self.failures = 0
+        self.last_write = 0.0
+        self.waiting_critical = 0
+        self.condition = threading.Condition()
+
+    def _current_rate(self) -> float:
+        # Near the end of the hourly budget, spread what is left over the
+        # time until reset rather than running into a lockout.
+        reset_in = self.reset_at - time.time()
+        if self.remaining is None or self.limit is None or reset_in <= 0:
+            return self.rate
+        if self.remaining >= self.limit * 0.2:
+            return self.rate
+        available = self.remaining - self.reserve if self.remaining > self.reserve else self.remaining
+        return max(0.01, min(self.rate, available / reset_in))
+
+    def _delay(self, now: float, method: str, background: bool) -> float:
+        rate = self._current_rate()
+        self.tokens = min(float(self.burst), self.tokens + (now - self.updated) * rate)
+        self.updated = now
+        if now < self.open_until:
+            return self.open_until - now
+        if self.remaining is not None:
+            reset_in = self.reset_at - time.time()
+            if reset_in > 0 and self.remaining <= (self.reserve if background else 0):
+                if background:
+                    raise UploaderError(
+                        f"GitHub API kotasi upload icin ayrildi; arka plan islemi {int(reset_in)} sn sonra tekrar denenebilir."
+                    )
+                return reset_in + 1
+        if background and self.waiting_critical:
+            return 0.25
+        if method != "GET" and now - self.last_write < self.WRITE_INTERVAL:
+            return self.WRITE_INTERVAL - (now - self.last_write)
+        if self.tokens < 1:
+            return (1 - self.tokens) / rate
+        return 0.0
+
+    def acquire(self, method: str, background: bool = False) -> None:
+        method = method.upper()
+        with self.condition:
+            if not background:
+                self.waiting_critical += 1
+            try:
+                while True:
+                    now = time.monotonic()
+                    delay = self._delay(now, method, background)
+                    if delay <= 0:
+                        break
+                    self.condition.wait(min(delay, 5.0))
+                self.tokens -= 1
+                if self.remaining is not None:
+                    self.remaining -= 1
+                if method != "GET":
+                    self.last_write = now
+            finally:
+                if not background:
+                    self.waiting_critical -= 1
+                    self.condition.notify_all()
+
+    def record(self, response: Optional[requests.Response]) -> bool:
+        """Update the budget from a response (None = connection error); True means rate limited."""
+        limited = False
+        with self.condition:
+            now = time.monotonic()
+            if response is not None and response.headers.get("X-RateLimit-Resource", "core") == "core":
+                try:
+                    self.limit = int(response.headers["X-RateLimit-Limit"])
+                    self.remaining = int(response.headers["X-RateLimit-Remaining"])
+                    self.reset_at = float(response.headers["X-RateLimit-Reset"])
+                except (KeyError, ValueError):
+                    pass
+            if response is not None and response.status_code in (403, 429):
+                retry_after = response.headers.get("Retry-After")
+                if response.status_code == 429 or retry_after or "rate limit" in response.text[:500].lower():
+                    limited = True
+                    try:
+                        pause = float(retry_after) if retry_after else 60.0
+                    except ValueError:
+                        pause = 60.0
+                    if response.headers.get("X-RateLimit-Remaining") == "0":
+                        pause = max(pause if retry_after else 0.0, self.reset_at - time.time() + 1)
+                    self.open_until = max(self.open_until, now + pause)
+                    LOGGER.warning("GitHub API hiz siniri: %.0f sn bekleniyor", pause)
+            elif response is not None and response.status_code < 500:
+                self.failures = 0
+            else:
+                self.failures += 1
+                if self.failures >= self.FAILURE_THRESHOLD:
+                    pause = min(300.0, 5.0 * 2 ** (self.failures - self.FAILURE_THRESHOLD))
+                    self.open_until = max(self.open_until, now + pause)
+                    LOGGER.warning("GitHub API ust uste %s kez hata verdi; %.0f sn ara veriliyor", self.failures, pause)
+            self.condition.notify_all()
+        return limited
+
+
+API_SCHEDULER = ApiScheduler(API_REQUESTS_PER_SECOND, API_BURST, API_BACKGROUND_RESERVE)
+_API_CONTEXT = threading.local()
+
+
+@contextlib.contextmanager
+def background_api_calls() -> Any:
+    """Mark API calls made by this thread as background work (cleanup scans etc.)."""
+    previous = getattr(_API_CONTEXT, "background", False)
+    _API_CONTEXT.background = True
+    try:
+        yield
+    finally:
+        _API_CONTEXT.background = previous
+
+
+def map_concurrent(
+    func: Callable[[Any], Any],
+    items: Iterable[Any],
+    *,
+    label: str,
+    stage: Optional[str] = None,
+    workers: int = FANOUT_WORKERS,
+    unit: str = "repo",
+) -> List[Any]:
+    """Run func over items on a bounded thread pool and return the results in input order.
+
+    API calls made by the workers still go through API_SCHEDULER, so the pool
+    only bounds local work (git, public HTTP). The first exception in input
+    order is re-raised once every item has finished.
+    """
+    items = list(items)
+    if not items:
+        return []
+    background = getattr(_API_CONTEXT, "background", False)
+
+    def call(item: Any) -> Any:
+        _API_CONTEXT.background = background
+        return func(item)
+
+    results: List[Any] = [None] * len(items)
+    errors: List[Optional[Exception]] = [None] * len(items)
+    started = time.monotonic()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(workers, len(items)), thread_name_prefix="fanout") as executor:
+        futures = {executor.submit(call, item): index for index, item in enumerate(items)}
+        for future in concurrent.futures.as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as exc:
+                errors[index] = exc
+    elapsed = max(time.monotonic() - started, 0.001)
+    rate = len(items) / elapsed
+    emit("throughput", f"{label}: {len(items)} {unit}, {elapsed:.1f} sn ({rate:.1f} {unit}/sn)", stage=stage, throughput=rate)
+    for error in errors:
+        if error is not None:
+            raise error
+    return results
+
+
+API_CACHE_LOCK = threading.Lock()
+API_CACHE_HEADERS = ("ETag", "Last-Modified", "Content-Type", "Link")
+# Responses larger than this are not worth a disk copy (full tree listings).
+API_CACHE_ENTRY_LIMIT = 1024 * 1024
+# Git objects addressed by SHA never change; caching them only fills the disk.
+API_CACHE_SKIP = re.compile(r"/git/(?:trees|blobs|commits)/[0-9a-f]{40}(?:$|\?)")
+_api_cache_bytes: Optional[int] = None
+
+
+def _api_cache_path(url: str, kwargs: Dict[str, Any]) -> Path:
+    # The token is part of the key so a different account never sees cached private data.
+    key = json.dumps(
+        {
+            "token": hashlib.sha1(GITHUB_TOKEN.encode("utf-8")).hexdigest(),
+            "url": url,
+            "params": kwargs.get("params"),
+            "headers": kwargs.get("headers"),
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return API_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _api_cache_response(entry: dict, url: str) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.encoding = "utf-8"
+    response._content = entry["body"].encode("utf-8")
+    response.headers.update(entry.get("headers") or {})
+    return response
+
+
+def _api_cache_store(path: Path, response: requests.Response) -> None:
+    headers = {name: response.headers[name] for name in API_CACHE_HEADERS if name in response.headers}
+    if "ETag" not in headers and "Last-Modified" not in headers:
+        return
+    if len(response.content) > API_CACHE_ENTRY_LIMIT:
+        return
+    try:
+        body = response.content.decode("utf-8")
+    except UnicodeDecodeError:
+        return
+    with API_CACHE_LOCK:
+        atomic_write_json(path, {"url": response.url, "headers": headers, "body": body})
+        _api_cache_prune(path)
+
+
+def _api_cache_prune(stored: Path) -> None:
+    # Called with API_CACHE_LOCK held. Entries are touched on every hit, so
+    # the oldest modification time is the least recently used response.
+    global _api_cache_bytes
+    if not API_CACHE_MAX_BYTES:
+        return
+    if _api_cache_bytes is None:
+        _api_cache_bytes = sum(entry.stat().st_size for entry in API_CACHE_DIR.glob("*.json"))
+    else:
+        _api_cache_bytes += stored.stat().st_size
+    if _api_cache_bytes <= API_CACHE_MAX_BYTES:
+        return
+    entries = []
+    for entry in API_CACHE_DIR.glob("*.json"):
+        try:
+            info = entry.stat()
+        except OSError:
+            continue
+        entries.append((info.st_mtime, info.st_size, entry))
+    entries.sort(key=lambda item: item[0])
+    total = sum(size for _, size, _ in entries)
+    # Prune to 80% so the next few stores do not rescan the directory.
+    for _, size, entry in entries:
+        if total <= API_CACHE_MAX_BYTES * 0.8:
+            break
+        try:
+            entry.unlink()
+            total -= size
+        except OSError:
+            pass
+    _api_cache_bytes = total
+
+
 def api_request(
     method: str,
     path: str,
@@ -225,26 +591,51 @@ def api_request(
     **kwargs: Any,
 ) -> requests.Response:
     url = path if path.startswith("http") else f"{API_ROOT}{path}"
+    cache_path: Optional[Path] = None
+    cached: dict = {}
+    if API_CACHE and method.upper() == "GET" and not API_CACHE_SKIP.search(url):
+        # Conditional requests: a 304 is served from disk and does not count against the rate limit.
+        cache_path = _api_cache_path(url, kwargs)
+        with API_CACHE_LOCK:
+            cached = load_json(cache_path)
+        if cached.get("body") is not None:
+            headers = dict(kwargs.get("headers") or {})
+            cached_headers = cached.get("headers") or {}
+            if cached_headers.get("ETag"):
+                headers["If-None-Match"] = cached_headers["ETag"]
+            if cached_headers.get("Last-Modified"):
+                headers["If-Modified-Since"] = cached_headers["Last-Modified"]
+            kwargs = {**kwargs, "headers": headers}
+    background = getattr(_API_CONTEXT, "background", False)
     last_error: Optional[Exception] = None
     for attempt in range(1, retries + 1):
+        API_SCHEDULER.acquire(method, background)
         try:
             response = SESSION.request(method, url, timeout=timeout, **kwargs)
         except requests.RequestException as exc:
+            API_SCHEDULER.record(None)
             last_error = exc
             if attempt < retries:
                 time.sleep(min(12, 2 ** (attempt - 1)))
                 continue
             raise UploaderError(f"GitHub API baglanti hatasi: {exc}") from exc
+        limited = API_SCHEDULER.record(response)
+        if response.status_code == 304 and cached.get("body") is not None:
+            response = _api_cache_response(cached, url)
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+        elif cache_path is not None and response.status_code == 200:
+            _api_cache_store(cache_path, response)
 
         if response.status_code in expected:
             return response
-        if response.status_code in (429, 500, 502, 503, 504) and attempt < retries:
-            retry_after = response.headers.get("Retry-After")
-            try:
-                delay = float(retry_after) if retry_after else min(15, 2 ** (attempt - 1))
-            except ValueError:
-                delay = min(15, 2 ** (attempt - 1))
-            time.sleep(delay)
+        if limited and attempt < retries:
+            # The scheduler holds the next acquire() until the limit is lifted.
+            continue
+        if response.status_code in (500, 502, 503, 504) and attempt < retries:
+            time.sleep(min(15, 2 ** (attempt - 1)))
             continue
         raise UploaderError(
             f"GitHub API hatasi {response.status_code} ({method} {path}): {_response_message(response)}"
@@ -314,12 +705,14 @@ def run_command(
     env: Optional[dict] = None,
     capture: bool = True,
     allow_failure: bool = False,
+    input: Optional[str] = None,
 ) -> subprocess.CompletedProcess:
     kwargs: Dict[str, Any] = {
         "cwd": str(cwd) if cwd else None,
         "env": env,
         "text": True,
         "check": False,
+        "input": input,
     }
     if capture:
         kwargs.update({"stdout": subprocess.PIPE, "stderr": subprocess.PIPE})
@@ -334,8 +727,16 @@ def run_command(
     return result
 
 
-def git(args: Sequence[str], repo_path: Path, *, capture: bool = True, env: Optional[dict] = None, allow_failure: bool = False) -> subprocess.CompletedProcess:
-    return run_command(["git", *args], cwd=repo_path, capture=capture, env=env, allow_failure=allow_failure)
+def git(
+    args: Sequence[str],
+    repo_path: Path,
+    *,
+    capture: bool = True,
+    env: Optional[dict] = None,
+    allow_failure: bool = False,
+    input: Optional[str] = None,
+) -> subprocess.CompletedProcess:
+    return run_command(["git", *args], cwd=repo_path, capture=capture, env=env, allow_failure=allow_failure, input=input)
 
 
 def check_git() -> None:
@@ -468,7 +869,7 @@ def write_git_exclude(repo_path: Path) -> None:
     info.mkdir(parents=True, exist_ok=True)
     exclude = info / "exclude"
     current = exclude.read_text(encoding="utf-8") if exclude.exists() else ""
-    additions = [MARKER_NAME, ".deepzoom_tmp/", ".deepzoom_tmp.dzi", ".deepzoom_tmp_files/"]
+    additions = [MARKER_NAME, MANIFEST_DIR_NAME + "/", ".deepzoom_tmp/", ".deepzoom_tmp.dzi", ".deepzoom_tmp_files/"]
     lines = set(current.splitlines())
     with exclude.open("a", encoding="utf-8") as handle:
         for item in additions:
@@ -480,6 +881,33 @@ def write_git_exclude(repo_path: Path) -> None:
                 current += item + "\n"
 
 
+# Tiles are already JPEG/WebP compressed: zlib and delta search only cost CPU.
+GIT_PAYLOAD_CONFIG: Tuple[Tuple[str, str], ...] = (
+    ("core.looseCompression", "0"),
+    ("pack.compression", "0"),
+    ("pack.window", "0"),
+    ("pack.depth", "0"),
+    ("pack.threads", "0"),
+    ("index.threads", "true"),
+    ("core.untrackedCache", "true"),
+    ("gc.auto", "0"),
+)
+
+
+def apply_git_payload_profile(repo_path: Path) -> None:
+    for key, value in GIT_PAYLOAD_CONFIG:
+        git(["config", key, value], repo_path)
+    attributes = repo_path / ".git" / "info" / "attributes"
+    attributes.parent.mkdir(parents=True, exist_ok=True)
+    current = attributes.read_text(encoding="utf-8") if attributes.exists() else ""
+    lines = set(current.splitlines())
+    missing = [f"*{suffix} -delta" for suffix in TILE_SUFFIXES if f"*{suffix} -delta" not in lines]
+    if missing:
+        prefix = "\n" if current and not current.endswith("\n") else ""
+        with attributes.open("a", encoding="utf-8") as handle:
+            handle.write(prefix + "\n".join(missing) + "\n")
+
+
 def remote_branch_sha(repo_name: str, branch: str) -> Optional[str]:
     response = api_request(
         "GET",
@@ -491,37 +919,105 @@ def remote_branch_sha(repo_name: str, branch: str) -> Optional[str]:
     return response.json().get("sha")
 
 
-def authenticated_git_push(repo_path: Path, branch: str, repo_name: str) -> None:
+def _push_with_retries(
+    repo_path: Path,
+    branch: str,
+    repo_name: str,
+    sha: str,
+    env: dict,
+    label: str,
+    *,
+    force: bool = False,
+) -> None:
+    # Pushing an explicit commit lets chunked uploads advance the branch one part at a time.
+    local_sha = git(["rev-parse", "HEAD"], repo_path).stdout.strip()
+    local_branch = git(["rev-parse", "--abbrev-ref", "HEAD"], repo_path).stdout.strip()
+    refspec = branch if sha == local_sha and local_branch == branch else f"{sha}:refs/heads/{branch}"
+    if force:
+        refspec = f"+{sha}:refs/heads/{branch}"
+    last_error = ""
+    for attempt in range(1, 4):
+        say(
+            f"GitHub'a push ediliyor{label} ({attempt}/3)",
+            repo=repo_name,
+            stage="push",
+            progress=58,
+        )
+        result = git(
+            ["push", "-u", "origin", refspec],
+            repo_path,
+            capture=True,
+            env=env,
+            allow_failure=True,
+        )
+        if result.returncode == 0:
+            return
+        last_error = ((result.stderr or "") + "\n" + (result.stdout or "")).strip()
+        try:
+            if remote_branch_sha(repo_name, branch) == sha:
+                say("Push cevabi kesildi ama commit GitHub'da dogrulandi.", repo=repo_name)
+                return
+        except Exception:
+            pass
+        if attempt < 3:
+            time.sleep(3 * attempt)
+    raise UploaderError(f"Git push basarisiz ({repo_name}{label}): {last_error[-1200:]}")
+
+
+def authenticated_git_push(
+    repo_path: Path,
+    branch: str,
+    repo_name: str,
+    chunks: Sequence[str] = (),
+    done: int = 0,
+    on_chunk: Optional[Callable[[int], None]] = None,
+) -> None:
+    """Push HEAD, or the chunk commits leading to HEAD one by one.
+
+    `done` is the number of chunks already pushed according to the job state;
+    the remote branches are checked as well so an interrupted upload resumes
+    from the first chunk GitHub does not have yet. When the branch is already
+    published, every chunk but the last goes to PUSH_CHUNK_BRANCH and the
+    branch itself moves once, straight to the finished commit.
+    """
     auth_dir, env = make_askpass()
     try:
         local_sha = git(["rev-parse", "HEAD"], repo_path).stdout.strip()
-        last_error = ""
-        for attempt in range(1, 4):
-            say(
-                f"GitHub'a push ediliyor ({attempt}/3)",
-                repo=repo_name,
-                stage="push",
-                progress=58,
-            )
+        commits = list(chunks) if chunks and chunks[-1] == local_sha else [local_sha]
+        start = min(done, len(commits) - 1) if len(commits) > 1 else 0
+        target = branch
+        if len(commits) > 1:
+            try:
+                remote_sha = remote_branch_sha(repo_name, branch)
+                if remote_sha is not None and remote_sha not in commits:
+                    # A live branch: keep partial trees away from Pages.
+                    target = PUSH_CHUNK_BRANCH
+                    remote_sha = remote_branch_sha(repo_name, PUSH_CHUNK_BRANCH)
+                start = commits.index(remote_sha) + 1 if remote_sha in commits else 0
+            except Exception:
+                pass
+            if start:
+                say(f"Push {start}/{len(commits)} parcadan devam ediyor.", repo=repo_name, stage="push")
+        for number in range(start, len(commits)):
+            label = f" [{number + 1}/{len(commits)}]" if len(commits) > 1 else ""
+            last = number == len(commits) - 1
+            if last or target == branch:
+                _push_with_retries(repo_path, branch, repo_name, commits[number], env, label)
+            else:
+                # The side branch may hold chunks of an abandoned attempt.
+                _push_with_retries(repo_path, target, repo_name, commits[number], env, label, force=True)
+            if on_chunk is not None:
+                on_chunk(number + 1)
+        if target != branch:
             result = git(
-                ["push", "-u", "origin", branch],
+                ["push", "origin", f":refs/heads/{PUSH_CHUNK_BRANCH}"],
                 repo_path,
                 capture=True,
                 env=env,
                 allow_failure=True,
             )
-            if result.returncode == 0:
-                return
-            last_error = ((result.stderr or "") + "\n" + (result.stdout or "")).strip()
-            try:
-                if remote_branch_sha(repo_name, branch) == local_sha:
-                    say("Push cevabi kesildi ama commit GitHub'da dogrulandi.", repo=repo_name)
-                    return
-            except Exception:
-                pass
-            if attempt < 3:
-                time.sleep(3 * attempt)
-        raise UploaderError(f"Git push basarisiz ({repo_name}): {last_error[-1200:]}")
+            if result.returncode != 0:
+                LOGGER.warning("Could not delete %s in %s: %s", PUSH_CHUNK_BRANCH, repo_name, (result.stderr or "").strip())
     finally:
         shutil.rmtree(auth_dir, ignore_errors=True)
 
@@ -573,6 +1069,7 @@ class SlideJob:
     explicit_repo: bool = False
     branch: str = "main"
     prepared: bool = False
+    encoding_profile: str = DEEPZOOM_PROFILE
     state: Dict[str, Any] = field(default_factory=dict)
 
     @property
@@ -608,6 +1105,7 @@ class SlideJob:
                 "branch": self.branch,
                 "explicit_repo": self.explicit_repo,
                 "prepared": self.prepared,
+                "encoding_profile": self.encoding_profile,
                 "updated_at": time.strftime("%Y-%m-%d %H:%M:%S"),
             }
         )
@@ -674,6 +1172,7 @@ def build_jobs(svs_files: List[Path], remote_names: Set[str]) -> List[SlideJob]:
             thumb = side_thumb if side_thumb and side_thumb.exists() else None
 
         prepared = bool(meta.get("prepared", False))
+        encoding_profile = str(meta.get("encoding_profile") or DEEPZOOM_PROFILE)
         branch = str(meta.get("branch") or (pending or {}).get("branch") or "main")
         job = SlideJob(
             svs_path=svs_path,
@@ -685,6 +1184,7 @@ def build_jobs(svs_files: List[Path], remote_names: Set[str]) -> List[SlideJob]:
             explicit_repo=bool(explicit_repo or meta.get("explicit_repo")),
             branch=branch,
             prepared=prepared,
+            encoding_profile=encoding_profile,
             state=meta,
         )
         if "created_at" not in job.state:
@@ -694,12 +1194,21 @@ def build_jobs(svs_files: List[Path], remote_names: Set[str]) -> List[SlideJob]:
     return jobs
 
 
-def save_job_preparation(job: SlideJob, title: str, description: str, thumbnail: Optional[Path]) -> None:
+def save_job_preparation(
+    job: SlideJob,
+    title: str,
+    description: str,
+    thumbnail: Optional[Path],
+    encoding_profile: Optional[str] = None,
+) -> None:
     title = title.strip()
     if not title:
         raise UploaderError("Baslik bos olamaz.")
     if thumbnail and not thumbnail.exists():
         raise UploaderError(f"Thumbnail dosyasi bulunamadi: {thumbnail}")
+    if encoding_profile is not None:
+        deepzoom_profile(encoding_profile)
+        job.encoding_profile = encoding_profile
     job.slide_title = title
     job.description = description.strip()
     job.thumbnail_source = thumbnail
@@ -712,33 +1221,266 @@ def save_job_preparation(job: SlideJob, title: str, description: str, thumbnail:
 # DeepZoom / thumbnail / slide repository
 # -----------------------------------------------------------------------------
 
+# The OpenSeadragon bundle is served once from the gallery repo for every
+# slide (same github.io host, so the browser caches it across slides); the
+# pinned cdnjs copy is only loaded when that file is missing. The minimap is
+# thumbnail.jpg with the visible region drawn over it, so it costs one small
+# image instead of a second tile pyramid.
 VIEWER_HTML = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/openseadragon/4.1.0/openseadragon.min.js"></script>
+    <title>{title}</title>{preload}
     <style>
         html, body, #openseadragon {{ width: 100%; height: 100%; margin: 0; background: #111; }}
+        #minimap {{ position: fixed; right: 12px; bottom: 12px; width: 180px; max-width: 35vw; border: 1px solid #555; background: #000; cursor: pointer; z-index: 10; }}
+        #minimap img {{ display: block; width: 100%; }}
+        #minimap div {{ position: absolute; border: 2px solid #ef4444; box-sizing: border-box; pointer-events: none; }}
     </style>
 </head>
 <body>
     <div id="openseadragon"></div>
+    <div id="minimap" hidden><img src="thumbnail.jpg" alt=""><div></div></div>
+    <script>
+        // The self-hosted bundle may be missing; fall back to cdnjs with a
+        // script element (browsers block document.write of cross-origin
+        // scripts on slow connections) and start once either one has loaded.
+        function osdLoaded(base) {{
+            if (window.OpenSeadragon) {{ startViewer(base); }} else {{ loadFallback(); }}
+        }}
+        function loadFallback() {{
+            if (loadFallback.done) {{ return; }}
+            loadFallback.done = true;
+            var script = document.createElement("script");
+            script.src = "{cdn_base}openseadragon.min.js";
+            script.onload = function () {{ if (window.OpenSeadragon) {{ startViewer("{cdn_base}"); }} }};
+            document.head.appendChild(script);
+        }}
+        function startViewer(osdBase) {{
+            var viewer = OpenSeadragon({{
+                id: "openseadragon",
+                prefixUrl: osdBase + "images/",
+                tileSources: {tile_source},
+                showNavigator: false,
+                maxZoomPixelRatio: 2,
+                imageLoaderLimit: 8,
+                maxImageCacheCount: 600,
+                blendTime: 0,
+                immediateRender: true
+            }});
+            var aspect = {aspect};
+            var map = document.getElementById("minimap");
+            var thumb = map.querySelector("img");
+            var region = map.querySelector("div");
+            function update() {{
+                var bounds = viewer.viewport.getBounds(true);
+                var left = Math.max(0, bounds.x), top = Math.max(0, bounds.y * aspect);
+                var right = Math.min(1, bounds.x + bounds.width), bottom = Math.min(1, (bounds.y + bounds.height) * aspect);
+                region.hidden = right <= left || bottom <= top;
+                region.style.left = left * 100 + "%";
+                region.style.top = top * 100 + "%";
+                region.style.width = (right - left) * 100 + "%";
+                region.style.height = (bottom - top) * 100 + "%";
+            }}
+            function show() {{
+                // A hand-picked thumbnail need not match the slide; only a
+                // same-shaped one can stand in for the whole image.
+                if (!aspect || Math.abs(thumb.naturalWidth / thumb.naturalHeight - aspect) / aspect > 0.02) {{ return; }}
+                map.hidden = false;
+                viewer.addHandler("update-viewport", update);
+                update();
+            }}
+            if (thumb.complete && thumb.naturalWidth) {{ show(); }} else {{ thumb.addEventListener("load", show); }}
+            map.addEventListener("click", function (event) {{
+                var box = thumb.getBoundingClientRect();
+                viewer.viewport.panTo(new OpenSeadragon.Point(
+                    (event.clientX - box.left) / box.width,
+                    (event.clientY - box.top) / box.height / aspect
+                ));
+            }});
+        }}
+    </script>
+    <script src="{osd_base}openseadragon.min.js" onload="osdLoaded('{osd_base}')" onerror="loadFallback()"></script>
     <script>
-        OpenSeadragon({{
-            id: "openseadragon",
-            prefixUrl: "https://cdnjs.cloudflare.com/ajax/libs/openseadragon/4.1.0/images/",
-            tileSources: "slide.dzi",
-            showNavigator: false,
-            maxZoomPixelRatio: 2
-        }});
+        if ("serviceWorker" in navigator) {{
+            {service_worker}
+        }}
     </script>
 </body>
 </html>
 """
 
 
+# sw.js in every slide repo. Pages sends tiles with a short max-age, so
+# repeat visits re-download them; the worker keeps slide_files/ responses in
+# Cache Storage up to a byte budget, evicting least recently used tiles. The
+# registration URL carries a version derived from slide.dzi and the tile
+# manifests, so a re-uploaded slide installs a new worker that drops the old
+# cache. A small JSON entry in the same cache records sizes and last use.
+VIEWER_SERVICE_WORKER = r"""var params = new URL(self.location).searchParams;
+var SCOPE = self.registration.scope;
+var PREFIX = "tiles:" + SCOPE + ":";
+var CACHE = PREFIX + (params.get("v") || "0");
+var BUDGET = Number(params.get("budget")) || 200 * 1024 * 1024;
+var INDEX = SCOPE + "__tile-cache-index__";
+var state = null;
+var saving = null;
+
+function load(cache) {
+    if (state) { return Promise.resolve(state); }
+    return cache.match(INDEX)
+        .then(function (response) { return response ? response.json() : null; })
+        .then(function (data) {
+            state = state || data || { bytes: 0, tiles: {} };
+            return state;
+        });
+}
+
+function save(cache) {
+    if (saving) { return; }
+    saving = setTimeout(function () {
+        saving = null;
+        cache.put(INDEX, new Response(JSON.stringify(state), { headers: { "Content-Type": "application/json" } }));
+    }, 1000);
+}
+
+function evict(cache) {
+    if (state.bytes <= BUDGET) { return Promise.resolve(); }
+    var urls = Object.keys(state.tiles).sort(function (a, b) { return state.tiles[a][1] - state.tiles[b][1]; });
+    var doomed = [];
+    // Trim to 90% so a full cache does not evict on every new tile.
+    while (urls.length && state.bytes > BUDGET * 0.9) {
+        var url = urls.shift();
+        state.bytes -= state.tiles[url][0];
+        delete state.tiles[url];
+        doomed.push(cache.delete(url));
+    }
+    return Promise.all(doomed);
+}
+
+self.addEventListener("install", function () { self.skipWaiting(); });
+
+self.addEventListener("activate", function (event) {
+    event.waitUntil(
+        caches.keys().then(function (names) {
+            return Promise.all(names.filter(function (name) {
+                return name.indexOf(PREFIX) === 0 && name !== CACHE;
+            }).map(function (name) { return caches.delete(name); }));
+        }).then(function () { return self.clients.claim(); })
+    );
+});
+
+self.addEventListener("fetch", function (event) {
+    var request = event.request;
+    if (request.method !== "GET" || request.url.indexOf(SCOPE + "slide_files/") !== 0) { return; }
+    var url = request.url.split("#")[0];
+    event.respondWith(caches.open(CACHE).then(function (cache) {
+        return Promise.all([cache.match(url), load(cache)]).then(function (found) {
+            if (found[0]) {
+                if (state.tiles[url]) { state.tiles[url][1] = Date.now(); save(cache); }
+                return found[0];
+            }
+            return fetch(request).then(function (response) {
+                if (!response.ok || response.type !== "basic") { return response; }
+                var copy = response.clone();
+                event.waitUntil(copy.blob().then(function (body) {
+                    return cache.put(url, new Response(body, { headers: copy.headers })).then(function () {
+                        if (!state.tiles[url]) { state.bytes += body.size; }
+                        state.tiles[url] = [body.size, Date.now()];
+                        return evict(cache);
+                    }).then(function () { save(cache); });
+                }));
+                return response;
+            });
+        });
+    }));
+});
+"""
+
+DEEPZOOM_PROFILES: Dict[str, Dict[str, Any]] = {
+    # libvips default geometry/quality; every slide uploaded before profiles existed used this.
+    "standard": {"format": "jpeg", "quality": 75, "tile_size": 254, "overlap": 1, "subsample": "auto", "depth": "onepixel"},
+    "compact": {"format": "jpeg", "quality": 70, "tile_size": 510, "overlap": 1, "subsample": "on", "depth": "onepixel"},
+    "high": {"format": "jpeg", "quality": 90, "tile_size": 254, "overlap": 1, "subsample": "off", "depth": "onepixel"},
+    "webp": {"format": "webp", "quality": 70, "tile_size": 510, "overlap": 1, "subsample": "auto", "depth": "onepixel"},
+    "webp-compact": {"format": "webp", "quality": 60, "tile_size": 1022, "overlap": 1, "subsample": "auto", "depth": "onetile"},
+}
+TILE_FORMATS = {"jpeg", "webp", "png"}
+TILE_SUFFIXES = (".jpeg", ".jpg", ".webp", ".png")
+
+
+def parse_profile_spec(spec: str) -> Dict[str, Any]:
+    profile = dict(DEEPZOOM_PROFILES["standard"])
+    for part in spec.split(","):
+        if "=" not in part:
+            continue
+        key, value = (item.strip().lower() for item in part.split("=", 1))
+        if key in {"quality", "tile_size", "overlap"}:
+            profile[key] = int(value)
+        elif key in {"format", "subsample", "depth"}:
+            profile[key] = value
+    return profile
+
+
+if DEEPZOOM_PROFILE_CUSTOM:
+    DEEPZOOM_PROFILES["custom"] = parse_profile_spec(DEEPZOOM_PROFILE_CUSTOM)
+
+
+def deepzoom_profile(name: Optional[str]) -> Dict[str, Any]:
+    key = (name or DEEPZOOM_PROFILE).strip().lower()
+    if key not in DEEPZOOM_PROFILES:
+        raise UploaderError(f"Bilinmeyen DeepZoom profili: {name}. Secenekler: {', '.join(DEEPZOOM_PROFILES)}")
+    profile = dict(DEEPZOOM_PROFILES[key])
+    if profile["format"] not in TILE_FORMATS:
+        raise UploaderError(f"DeepZoom profili '{key}' desteklenmeyen format kullaniyor: {profile['format']}")
+    if profile["depth"] not in {"onepixel", "onetile"}:
+        raise UploaderError(f"DeepZoom profili '{key}' icin depth onepixel veya onetile olmali.")
+    if not 1 <= int(profile["quality"]) <= 100 or int(profile["tile_size"]) < 16 or int(profile["overlap"]) < 0:
+        raise UploaderError(f"DeepZoom profili '{key}' gecersiz kalite/karo ayari iceriyor.")
+    profile["name"] = key
+    return profile
+
+
+def dzsave_options(profile: Dict[str, Any]) -> Dict[str, Any]:
+    quality = int(profile["quality"])
+    if profile["format"] == "webp":
+        suffix = f".webp[Q={quality}"
+        if profile["subsample"] in {"off", "smart"}:
+            suffix += ",smart_subsample"
+        suffix += "]"
+    elif profile["format"] == "png":
+        suffix = ".png"
+    else:
+        suffix = f".jpeg[Q={quality},optimize_coding,subsample_mode={profile['subsample']}]"
+    return {
+        "suffix": suffix,
+        "tile_size": int(profile["tile_size"]),
+        "overlap": int(profile["overlap"]),
+        "depth": profile["depth"],
+    }
+
+
+def read_dzi_info(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        root = ElementTree.fromstring(path.read_text(encoding="utf-8"))
+    except (OSError, ElementTree.ParseError):
+        return None
+    size = next((child for child in root if child.tag.endswith("Size")), None)
+    if size is None:
+        return None
+    try:
+        return {
+            "format": root.get("Format", "jpeg"),
+            "overlap": int(root.get("Overlap", "1")),
+            "tile_size": int(root.get("TileSize", "254")),
+            "width": int(size.get("Width", "0")),
+            "height": int(size.get("Height", "0")),
+        }
+    except ValueError:
+        return None
+
+
 def import_pyvips():
     try:
         import pyvips  # type: ignore
@@ -786,6 +1528,8 @@ def prepare_local_repo(job: SlideJob, remote_info: Optional[dict]) -> str:
     if "origin" not in remotes:
         git(["remote", "add", "origin", f"https://github.com/{GITHUB_USERNAME}/{job.repo_name}.git"], repo_path)
     write_git_exclude(repo_path)
+    if GIT_PAYLOAD_PROFILE:
+        apply_git_payload_profile(repo_path)
     write_marker(job)
     git(["config", "user.name", GITHUB_USERNAME], repo_path)
     git(["config", "user.email", f"{GITHUB_USERNAME}@users.noreply.github.com"], repo_path)
@@ -794,12 +1538,58 @@ def prepare_local_repo(job: SlideJob, remote_info: Optional[dict]) -> str:
 
 
 def clear_slide_payload(repo_path: Path) -> None:
-    for name in ("slide.dzi", "slide_files", "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png"):
+    for name in ("slide.dzi", "slide_files", MANIFEST_DIR_NAME, "thumbnail.jpg", "thumbnail.jpeg", "thumbnail.png"):
         path = repo_path / name
         if path.is_dir():
             safe_rmtree(path)
         elif path.exists():
             path.unlink()
+    for path in repo_path.glob("thumbnail-*.jpg"):
+        path.unlink()
+
+
+def git_blob_sha(data: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def level_tile_grid(width: int, height: int, tile_size: int, level: int, max_level: int) -> Tuple[int, int]:
+    shift = max_level - level
+    level_w = -(-width // (1 << shift))
+    level_h = -(-height // (1 << shift))
+    return -(-level_w // tile_size), -(-level_h // tile_size)
+
+
+def write_level_manifest(tiles_dir: Path, manifest_dir: Path, level: int, expected: int) -> Dict[str, Any]:
+    # Tile checksums are git blob ids, so the manifest can be compared with a
+    # remote git tree without downloading anything.
+    files: Dict[str, List[Any]] = {}
+    total = 0
+    level_dir = tiles_dir / str(level)
+    for path in sorted(level_dir.iterdir()) if level_dir.is_dir() else []:
+        if not path.is_file():
+            continue
+        data = path.read_bytes()
+        files[path.name] = [git_blob_sha(data), len(data)]
+        total += len(data)
+    digest = hashlib.sha1("\n".join(f"{name} {sha}" for name, (sha, _) in files.items()).encode("utf-8")).hexdigest()
+    manifest = {"level": level, "expected": expected, "tiles": len(files), "bytes": total, "digest": digest, "files": files}
+    if len(files) != expected:
+        raise UploaderError(f"DeepZoom seviyesi {level} eksik: {len(files)}/{expected} karo.")
+    atomic_write_json(manifest_dir / f"level-{level}.json", manifest)
+    return manifest
+
+
+def completed_manifest_levels(manifest_dir: Path) -> Set[int]:
+    done: Set[int] = set()
+    for path in manifest_dir.glob("level-*.json") if manifest_dir.is_dir() else []:
+        data = load_json(path)
+        if data.get("tiles") is not None and data.get("tiles") == data.get("expected"):
+            done.add(int(data.get("level", -1)))
+    return done
+
+
+def read_manifest_index(repo_path: Path) -> dict:
+    return load_json(repo_path / MANIFEST_DIR_NAME / "index.json")
 
 
 def deepzoom_complete(repo_path: Path) -> bool:
@@ -807,39 +1597,723 @@ def deepzoom_complete(repo_path: Path) -> bool:
     tiles = repo_path / "slide_files"
     if not dzi.exists() or not tiles.is_dir():
         return False
+    if (repo_path / MANIFEST_DIR_NAME).is_dir():
+        return bool(read_manifest_index(repo_path).get("complete"))
+    # Slides converted before manifests existed.
     try:
-        return any(tiles.rglob("*.jpeg")) or any(tiles.rglob("*.jpg")) or any(tiles.rglob("*.png"))
+        return any(path.suffix.lower() in TILE_SUFFIXES for path in tiles.rglob("*.*"))
     except OSError:
         return False
 
 
-def generate_deepzoom_atomic(job: SlideJob) -> None:
+DEEPZOOM_SLOTS = threading.BoundedSemaphore(DEEPZOOM_WORKERS)
+ACTIVE_DEEPZOOM_WORKERS: Dict[str, Any] = {}
+ACTIVE_DEEPZOOM_LOCK = threading.Lock()
+DEEPZOOM_CANCEL = threading.Event()
+
+
+def _limit_worker_memory(limit_bytes: int) -> None:
+    if not limit_bytes:
+        return
+    try:
+        import resource  # POSIX only
+    except ImportError:
+        return
+    try:
+        resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, limit_bytes))
+    except (ValueError, OSError):
+        pass
+
+
+TISSUE_PREVIEW_PX = 2048
+
+
+def deepzoom_settings(profile: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "dzsave": dzsave_options(profile),
+        "tissue": {
+            "enabled": TISSUE_DETECTION,
+            "white_level": TISSUE_WHITE_LEVEL,
+            "margin": TISSUE_MARGIN_PX,
+            "preview_px": TISSUE_PREVIEW_PX,
+        },
+        "native_pyramid": NATIVE_PYRAMID,
+        "max_upsample": NATIVE_PYRAMID_MAX_UPSAMPLE,
+    }
+
+
+def _rgb_image(image: Any) -> Any:
+    if image.hasalpha():
+        image = image.flatten(background=[255, 255, 255])
+    if image.bands > 3:
+        image = image.extract_band(0, n=3)
+    return image
+
+
+def _fit_exact(image: Any, width: int, height: int) -> Any:
+    if image.width == width and image.height == height:
+        return image
+    image = image.resize(width / float(image.width), vscale=height / float(image.height))
+    if image.width != width or image.height != height:
+        image = image.embed(0, 0, max(width, image.width), max(height, image.height), extend="copy")
+        image = image.crop(0, 0, width, height)
+    return image
+
+
+def detect_tissue(
+    pyvips: Any,
+    svs_path: str,
+    width: int,
+    height: int,
+    settings: Dict[str, Any],
+) -> Tuple[Optional[Any], Optional[List[int]], Dict[str, Any]]:
+    """Find tissue on a low-resolution preview; returns (level-0 crop box, info).
+
+    The preview only decides where the slide is cropped: the box around the
+    dilated tissue mask. Pixels inside the box are never altered, since pale
+    tissue or small fragments can look like glass at preview scale.
+    """
+    info: Dict[str, Any] = {"width": int(width), "height": int(height), "cropped": False}
+    if not settings.get("enabled"):
+        return None, info
+
+    preview = _rgb_image(pyvips.Image.thumbnail(svs_path, int(settings["preview_px"])))
+    white = int(settings["white_level"])
+    dark = (preview < 16).bandand()
+    # No median filter: a lone speck only widens the box, while filtering
+    # could drop a small fragment near the edge of the slide.
+    mask = (preview < white).bandor() & dark.invert()
+    scale_x = width / float(preview.width)
+    scale_y = height / float(preview.height)
+    radius = max(1, int(round(int(settings["margin"]) / max(scale_x, 1.0))))
+    size = 2 * radius + 1
+    mask = mask.rank(size, size, size * size - 1)
+
+    left, top, trim_w, trim_h = mask.find_trim(threshold=0, background=[0])
+    if trim_w <= 0 or trim_h <= 0:
+        info["tissue_found"] = False
+        return None, info
+    info["tissue_found"] = True
+
+    x0 = max(0, int(left * scale_x))
+    y0 = max(0, int(top * scale_y))
+    x1 = min(width, int((left + trim_w) * scale_x + 0.999))
+    y1 = min(height, int((top + trim_h) * scale_y + 0.999))
+    crop: Optional[List[int]] = None
+    # Cropping only pays off when it removes a meaningful border.
+    if (x1 - x0) * (y1 - y0) < 0.95 * width * height:
+        crop = [x0, y0, x1 - x0, y1 - y0]
+        info.update({"cropped": True, "crop": crop})
+    return crop, info
+
+
+def apply_tissue(image: Any, crop: Optional[List[int]], full_width: int, full_height: int) -> Any:
+    # image may be any pyramid level; the level-0 crop box is scaled to its size.
+    image = _rgb_image(image)
+    if crop:
+        fx = image.width / float(full_width)
+        fy = image.height / float(full_height)
+        x, y, w, h = crop
+        x0 = min(image.width - 1, int(x * fx))
+        y0 = min(image.height - 1, int(y * fy))
+        x1 = min(image.width, max(x0 + 1, int((x + w) * fx + 0.999)))
+        y1 = min(image.height, max(y0 + 1, int((y + h) * fy + 0.999)))
+        image = image.crop(x0, y0, x1 - x0, y1 - y0)
+    return image
+
+
+def read_native_levels(image: Any) -> List[Tuple[int, float]]:
+    try:
+        count = int(image.get("openslide.level-count"))
+        return [(k, float(image.get(f"openslide.level[{k}].downsample"))) for k in range(count)]
+    except Exception:
+        return []
+
+
+def deepzoom_level_count(width: int, height: int) -> int:
+    longest = max(1, int(width), int(height))
+    return (longest - 1).bit_length() + 1
+
+
+def deepzoom_min_level(width: int, height: int, tile_size: int, depth: str) -> int:
+    max_level = deepzoom_level_count(width, height) - 1
+    if depth != "onetile":
+        return 0
+    level = max_level
+    while level > 0:
+        shift = max_level - level
+        if -(-width // (1 << shift)) <= tile_size and -(-height // (1 << shift)) <= tile_size:
+            break
+        level -= 1
+    return level
+
+
+def deepzoom_level_plan(
+    width: int,
+    height: int,
+    native: Sequence[Tuple[int, float]],
+    *,
+    tile_size: int,
+    depth: str,
+    max_upsample: float,
+) -> Optional[List[Tuple[int, List[int]]]]:
+    """Group DeepZoom levels by the native slide level each one is rendered from.
+
+    Every level is shrunk from the coarsest native level that is still at least
+    as sharp as the target, so the levels above the first reduced native level
+    come from level 0. With max_upsample above 1 such a level may instead use a
+    slightly coarser native level, upscaled by at most that factor. Returns
+    None when every level would come from level 0 (full recompute).
+    """
+    pyramid = sorted(native, key=lambda item: item[1])
+    if not any(d > 1.01 for _, d in pyramid):
+        return None
+    max_level = deepzoom_level_count(width, height) - 1
+    min_level = deepzoom_min_level(width, height, tile_size, depth)
+    groups: List[Tuple[int, List[int]]] = []
+    for level in range(max_level, min_level - 1, -1):
+        target = float(1 << (max_level - level))
+        finer = [(k, d) for k, d in pyramid if d <= target * 1.01]
+        source = max(finer, key=lambda item: item[1])[0] if finer else 0
+        if source == 0 and level != max_level and max_upsample > 1:
+            coarser = [(k, d) for k, d in pyramid if target * 1.01 < d <= target * max_upsample * 1.01]
+            if coarser:
+                source = min(coarser, key=lambda item: item[1])[0]
+        if groups and groups[-1][0] == source:
+            groups[-1][1].append(level)
+        else:
+            groups.append((source, [level]))
+    if len(groups) == 1:
+        return None
+    return groups
+
+
+def _dzsave_with_progress(image: Any, output_base: str, options: Dict[str, Any], events: Any, start: int, span: int) -> None:
+    last_percent = [-1]
+
+    def on_eval(_image: Any, progress: Any) -> None:
+        percent = start + int(getattr(progress, "percent", 0)) * span // 100
+        if percent != last_percent[0]:
+            last_percent[0] = percent
+            events.put(("progress", percent))
+
+    try:
+        image.set_progress(True)
+        image.signal_connect("eval", on_eval)
+    except Exception:
+        pass
+    image.dzsave(output_base, **options)
+
+
+# A tile is blank glass only if its own full-resolution pixels are all at
+# least BLANK_TILE_MIN and within BLANK_TILE_SPREAD of each other. Larger
+# files are not even decoded: uniform tiles compress far below this.
+BLANK_TILE_MIN = 230
+BLANK_TILE_SPREAD = 16
+BLANK_TILE_MAX_BYTES = 16 * 1024
+
+
+def flatten_blank_tiles(level_dir: Path, options: Dict[str, Any]) -> int:
+    """Rewrite blank-glass tiles of one level as identical pure white tiles; returns how many.
+
+    Identical tiles share one git blob. Only tiles that are already uniform
+    near-white are touched, so no real pixel is painted over.
+    """
+    pyvips = import_pyvips()
+    suffix = str(options.get("suffix") or ".jpeg")
+    blanks: Dict[Tuple[int, int], bytes] = {}
+    flattened = 0
+    for path in sorted(level_dir.iterdir()) if level_dir.is_dir() else []:
+        if not path.is_file() or path.stat().st_size > BLANK_TILE_MAX_BYTES:
+            continue
+        data = path.read_bytes()
+        tile = _rgb_image(pyvips.Image.new_from_buffer(data, ""))
+        low, high = tile.min(), tile.max()
+        if low < BLANK_TILE_MIN or high - low > BLANK_TILE_SPREAD:
+            continue
+        size = (int(tile.width), int(tile.height))
+        if size not in blanks:
+            white = (pyvips.Image.black(size[0], size[1], bands=3) + 255).cast("uchar")
+            blanks[size] = white.write_to_buffer(suffix)
+        if data != blanks[size]:
+            path.write_bytes(blanks[size])
+            flattened += 1
+    return flattened
+
+
+def build_native_pyramid(
+    pyvips: Any,
+    svs_path: str,
+    base: Any,
+    output_base: Path,
+    plan: List[Tuple[int, List[int]]],
+    options: Dict[str, Any],
+    crop: Optional[List[int]],
+    events: Any,
+    completed: Set[int],
+    flatten_blank: bool = False,
+) -> None:
+    full_w, full_h = int(base.width), int(base.height)
+    width, height = (crop[2], crop[3]) if crop else (full_w, full_h)
+    max_level = deepzoom_level_count(width, height) - 1
+    tiles_dir = output_base.parent / f"{output_base.name}_files"
+    tiles_dir.mkdir(parents=True, exist_ok=True)
+    manifest_dir = output_base.parent / "manifest"
+    dzi_path = output_base.parent / f"{output_base.name}.dzi"
+    scratch_root = output_base.parent / ".levels"
+    tile_size = int(options.get("tile_size", 254))
+
+    def level_size(level: int) -> Tuple[int, int]:
+        shift = max_level - level
+        return -(-width // (1 << shift)), -(-height // (1 << shift))
+
+    # One dzsave pass per group, so every native level is decoded exactly
+    # once. Only the last group keeps the profile depth; a middle group with
+    # several levels lets dzsave shrink on down and drops the extra levels,
+    # which costs little next to decoding its source again.
+    passes: List[Tuple[int, List[int], str]] = []
+    for index, (source, levels) in enumerate(plan):
+        if index == len(plan) - 1:
+            passes.append((source, levels, str(options.get("depth", "onepixel"))))
+        else:
+            passes.append((source, levels, "one" if len(levels) == 1 else "onepixel"))
+
+    weights = [level_size(levels[0])[0] * level_size(levels[0])[1] for _, levels, _ in passes]
+    total = float(sum(weights)) or 1.0
+    done = 0.0
+    for index, (source, levels, depth) in enumerate(passes):
+        last_pass = index == len(passes) - 1
+        top = levels[0]
+        if all(level in completed for level in levels) and (index > 0 or dzi_path.exists()):
+            done += weights[index] / total * 100
+            events.put(("progress", int(done)))
+            events.put(("levels", levels))
+            continue
+        # Sources grow coarser group by group, so level 0 only feeds the first pass.
+        image = base if source == 0 else pyvips.Image.new_from_file(svs_path, level=source, access="sequential")
+        image = _fit_exact(apply_tissue(image, crop, full_w, full_h), *level_size(top))
+        scratch = scratch_root / f"L{top}"
+        safe_rmtree(scratch)
+        scratch.mkdir(parents=True, exist_ok=True)
+        span = int(weights[index] / total * 100)
+        _dzsave_with_progress(image, str(scratch / "slide"), {**options, "depth": depth}, events, int(done), span)
+        done += weights[index] / total * 100
+        produced = sorted(
+            (int(p.name) for p in (scratch / "slide_files").iterdir() if p.is_dir() and p.name.isdigit()),
+            reverse=True,
+        )
+        # dzsave numbers levels relative to its own input; map them by rank.
+        moved: List[int] = []
+        for rank, name in enumerate(produced):
+            level = top - rank
+            if level < levels[-1]:
+                break
+            target = tiles_dir / str(level)
+            safe_rmtree(target)
+            shutil.move(str(scratch / "slide_files" / str(name)), str(target))
+            moved.append(level)
+        if index == 0:
+            shutil.move(str(scratch / "slide.dzi"), str(dzi_path))
+        safe_rmtree(scratch)
+        # The last pass uses the profile depth; dzsave decides where it stops.
+        for level in moved if last_pass else levels:
+            if flatten_blank:
+                flatten_blank_tiles(tiles_dir / str(level), options)
+            cols, rows = level_tile_grid(width, height, tile_size, level, max_level)
+            write_level_manifest(tiles_dir, manifest_dir, level, cols * rows)
+        events.put(("levels", levels))
+    safe_rmtree(scratch_root)
+
+
+def build_full_pyramid(
+    base: Any,
+    output_base: Path,
+    options: Dict[str, Any],
+    crop: Optional[List[int]],
+    events: Any,
+    flatten_blank: bool = False,
+) -> None:
+    # A single dzsave pass cannot stop half way, so it always starts clean;
+    # the manifest is written once all levels exist.
+    tiles_dir = output_base.parent / f"{output_base.name}_files"
+    manifest_dir = output_base.parent / "manifest"
+    safe_rmtree(tiles_dir)
+    safe_rmtree(manifest_dir)
+    image = apply_tissue(base, crop, base.width, base.height)
+    _dzsave_with_progress(image, str(output_base), options, events, 0, 100)
+    width, height = int(image.width), int(image.height)
+    max_level = deepzoom_level_count(width, height) - 1
+    tile_size = int(options.get("tile_size", 254))
+    levels = sorted((int(p.name) for p in tiles_dir.iterdir() if p.is_dir() and p.name.isdigit()), reverse=True)
+    for level in levels:
+        if flatten_blank:
+            flatten_blank_tiles(tiles_dir / str(level), options)
+        cols, rows = level_tile_grid(width, height, tile_size, level, max_level)
+        write_level_manifest(tiles_dir, manifest_dir, level, cols * rows)
+    events.put(("levels", levels))
+
+
+def _start_vips_child(memory_limit: int, threads: int) -> Any:
+    # Common setup for spawned pyvips children: thread count and memory cap
+    # are applied before libvips is loaded.
+    if threads:
+        os.environ["VIPS_CONCURRENCY"] = str(threads)
+    _limit_worker_memory(memory_limit)
+    pyvips = import_pyvips()
+    if memory_limit:
+        pyvips.cache_set_max_mem(max(64 * 1024 * 1024, memory_limit // 4))
+    return pyvips
+
+
+def _deepzoom_worker_main(
+    svs_path: str,
+    output_base: str,
+    settings: Dict[str, Any],
+    events: Any,
+    memory_limit: int,
+    threads: int,
+) -> None:
+    # Runs in a spawned child process. Only plain data crosses the process
+    # boundary; progress and errors go back through the events queue.
+    try:
+        pyvips = _start_vips_child(memory_limit, threads)
+        options = dict(settings.get("dzsave") or {})
+        base = pyvips.Image.new_from_file(svs_path, access="sequential")
+        tissue = settings.get("tissue") or {}
+        crop, tissue_info = detect_tissue(pyvips, svs_path, base.width, base.height, tissue)
+        events.put(("tissue", tissue_info))
+        flatten_blank = bool(tissue.get("enabled"))
+        plan = None
+        if settings.get("native_pyramid"):
+            width, height = (crop[2], crop[3]) if crop else (base.width, base.height)
+            plan = deepzoom_level_plan(
+                width,
+                height,
+                read_native_levels(base),
+                tile_size=int(options.get("tile_size", 254)),
+                depth=str(options.get("depth", "onepixel")),
+                max_upsample=float(settings.get("max_upsample", 1.0)),
+            )
+        completed = set(settings.get("completed_levels") or [])
+        if plan:
+            events.put(("pyramid", {"mode": "native", "groups": plan}))
+            build_native_pyramid(pyvips, svs_path, base, Path(output_base), plan, options, crop, events, completed, flatten_blank)
+        else:
+            events.put(("pyramid", {"mode": "full"}))
+            build_full_pyramid(base, Path(output_base), options, crop, events, flatten_blank)
+        events.put(("done", ""))
+    except MemoryError:
+        events.put(("error", "DeepZoom isci sureci bellek sinirini asti."))
+    except Exception as exc:
+        events.put(("error", str(exc)))
+
+
+def _slide_thumbnail(pyvips: Any, svs_path: str, tissue: Dict[str, Any]) -> Any:
+    # The DeepZoom image is cropped to the tissue box, so the automatic
+    # thumbnail must show the same region; the viewer minimap relies on it.
+    if not tissue.get("cropped") or not tissue.get("crop"):
+        return pyvips.Image.thumbnail(svs_path, THUMB_MAX_PX)
+    x, y, w, h = (int(value) for value in tissue["crop"])
+    full = max(int(tissue["width"]), int(tissue["height"]))
+    # Shrink the whole slide so the crop box comes out at THUMB_MAX_PX, with a
+    # cap that keeps a very small crop from decoding a huge intermediate.
+    size = min(full, int(math.ceil(full * THUMB_MAX_PX / float(max(w, h)))), THUMB_MAX_PX * 8)
+    image = pyvips.Image.thumbnail(svs_path, size)
+    scale = image.width / float(tissue["width"])
+    left = min(image.width - 1, int(x * scale))
+    top = min(image.height - 1, int(y * scale))
+    width = max(1, min(image.width - left, int(round(w * scale))))
+    height = max(1, min(image.height - top, int(round(h * scale))))
+    return image.crop(left, top, width, height)
+
+
+def _thumbnail_worker_main(
+    svs_path: str,
+    source: str,
+    repo_path: str,
+    tissue: Dict[str, Any],
+    events: Any,
+    memory_limit: int,
+    threads: int,
+) -> None:
+    # Same isolation as the DeepZoom child: the SVS is only ever opened here,
+    # so the GUI process keeps no libvips file handles or caches.
+    try:
+        pyvips = _start_vips_child(memory_limit, threads)
+        repo = Path(repo_path)
+        if source:
+            image = pyvips.Image.thumbnail(source, THUMB_MAX_PX)
+        else:
+            image = _slide_thumbnail(pyvips, svs_path, tissue)
+        for stale in repo.glob("thumbnail-*.jpg"):
+            stale.unlink()
+        destination = repo / "thumbnail.jpg"
+        _save_small_jpeg(image, destination)
+        _save_thumbnail_variants(image, repo)
+        events.put(("done", destination.stat().st_size))
+    except MemoryError:
+        events.put(("error", "Thumbnail isci sureci bellek sinirini asti."))
+    except Exception as exc:
+        events.put(("error", str(exc)))
+
+
+def _process_memory_bytes(pid: int) -> Optional[int]:
+    try:
+        import psutil  # type: ignore
+    except ImportError:
+        return None
+    try:
+        return int(psutil.Process(pid).memory_info().rss)
+    except Exception:
+        return None
+
+
+def run_vips_worker(
+    job: SlideJob,
+    target: Callable[..., None],
+    args: Tuple[Any, ...],
+    on_event: Callable[[str, Any], None],
+    *,
+    label: str,
+) -> Any:
+    """Run target(*args, events, memory_limit, threads) in a spawned child and return its "done" value.
+
+    Every event other than done/error is handed to on_event. The worker slots,
+    timeout, memory limit and cancellation apply to all pyvips children alike.
+    """
+    with DEEPZOOM_SLOTS:
+        if DEEPZOOM_CANCEL.is_set():
+            raise UploaderError(f"{label} islemi iptal edildi.")
+        threads = DEEPZOOM_WORKER_THREADS or max(1, (os.cpu_count() or 1) // DEEPZOOM_WORKERS)
+        ctx = multiprocessing.get_context("spawn")
+        events = ctx.Queue()
+        process = ctx.Process(
+            target=target,
+            args=(*args, events, DEEPZOOM_WORKER_MEMORY_BYTES, threads),
+            name=f"{label.lower()}-{job.repo_name}",
+            daemon=True,
+        )
+        process.start()
+        with ACTIVE_DEEPZOOM_LOCK:
+            ACTIVE_DEEPZOOM_WORKERS[job.repo_name] = process
+        deadline = time.monotonic() + DEEPZOOM_TIMEOUT if DEEPZOOM_TIMEOUT else None
+        result: Optional[Tuple[str, Any]] = None
+        try:
+            while result is None:
+                try:
+                    kind, value = events.get(timeout=0.5)
+                except queue.Empty:
+                    if DEEPZOOM_CANCEL.is_set():
+                        raise UploaderError(f"{label} islemi iptal edildi.")
+                    if deadline and time.monotonic() > deadline:
+                        raise UploaderError(f"{label} {DEEPZOOM_TIMEOUT} saniyede tamamlanmadi; isci durduruldu.")
+                    if DEEPZOOM_WORKER_MEMORY_BYTES:
+                        rss = _process_memory_bytes(process.pid or 0)
+                        if rss and rss > DEEPZOOM_WORKER_MEMORY_BYTES:
+                            raise UploaderError(
+                                f"{label} isci sureci bellek sinirini asti ({human_bytes(rss)}); isci durduruldu."
+                            )
+                    if not process.is_alive():
+                        try:
+                            kind, value = events.get(timeout=1)
+                        except queue.Empty:
+                            raise UploaderError(f"{label} isci sureci beklenmedik sekilde kapandi (kod {process.exitcode}).")
+                    else:
+                        continue
+                if kind in {"done", "error"}:
+                    result = (kind, value)
+                else:
+                    on_event(kind, value)
+        finally:
+            if process.is_alive():
+                if result is None or result[0] != "done":
+                    process.kill()
+                process.join(timeout=10)
+                if process.is_alive():
+                    process.kill()
+                    process.join(timeout=5)
+            with ACTIVE_DEEPZOOM_LOCK:
+                ACTIVE_DEEPZOOM_WORKERS.pop(job.repo_name, None)
+            events.close()
+        if result[0] == "error":
+            raise UploaderError(result[1] or f"{label} isci sureci hata verdi.")
+        return result[1]
+
+
+def run_deepzoom_worker(
+    job: SlideJob,
+    output_base: Path,
+    settings: Dict[str, Any],
+    on_levels: Optional[Callable[[List[int]], None]] = None,
+) -> Dict[str, Any]:
+    """Run one conversion in an isolated child process and relay its progress via emit()."""
+    details: Dict[str, Any] = {}
+
+    def on_event(kind: str, value: Any) -> None:
+        if kind == "progress":
+            percent = max(0, min(100, int(value)))
+            say(
+                f"DeepZoom uretiliyor... %{percent}",
+                repo=job.repo_name,
+                stage="deepzoom",
+                progress=20 + percent * 13 // 100,
+            )
+        elif kind == "tissue":
+            details["tissue"] = value
+            if value.get("cropped"):
+                _, _, crop_w, crop_h = value["crop"]
+                saved = 1 - (crop_w * crop_h) / float(max(1, value["width"] * value["height"]))
+                say(
+                    f"Doku alani bulundu; bos cam kirpildi (%{int(saved * 100)} daha kucuk alan).",
+                    repo=job.repo_name,
+                    stage="deepzoom",
+                )
+        elif kind == "pyramid":
+            details["pyramid"] = value.get("mode")
+            if value.get("mode") == "native":
+                say(
+                    "Alt seviyeler SVS icindeki hazir piramitten uretiliyor.",
+                    repo=job.repo_name,
+                    stage="deepzoom",
+                )
+        elif kind == "levels":
+            details.setdefault("levels_done", []).extend(value)
+            if on_levels is not None:
+                on_levels(list(value))
+
+    run_vips_worker(
+        job,
+        _deepzoom_worker_main,
+        (str(job.svs_path), str(output_base), settings),
+        on_event,
+        label="DeepZoom",
+    )
+    return details
+
+
+def cancel_deepzoom_workers() -> None:
+    """Stop running pyvips children; jobs not yet started in a pipeline stage are skipped."""
+    DEEPZOOM_CANCEL.set()
+    with ACTIVE_DEEPZOOM_LOCK:
+        processes = list(ACTIVE_DEEPZOOM_WORKERS.values())
+    for process in processes:
+        try:
+            if process.is_alive():
+                process.kill()
+        except Exception:
+            LOGGER.exception("DeepZoom isci sureci durdurulamadi")
+
+
+def conversion_signature(job: SlideJob, settings: Dict[str, Any]) -> dict:
+    source = job.svs_path.stat()
+    payload = {
+        "source_name": job.svs_path.name,
+        "source_size": source.st_size,
+        "source_mtime": int(source.st_mtime),
+        "settings": {key: value for key, value in settings.items() if key != "completed_levels"},
+    }
+    return json.loads(json.dumps(payload))
+
+
+def finalize_manifest(work: Path, profile: Dict[str, Any]) -> dict:
+    info = read_dzi_info(work / "slide.dzi")
+    if not info:
+        raise UploaderError("DeepZoom ciktilari eksik olustu (slide.dzi yok).")
+    max_level = deepzoom_level_count(info["width"], info["height"]) - 1
+    manifest_dir = work / "manifest"
+    present = completed_manifest_levels(manifest_dir)
+    min_level = 0
+    if profile["depth"] == "onetile" and present:
+        # dzsave decides exactly where a onetile pyramid ends.
+        min_level = min(present)
+    levels: Dict[str, Any] = {}
+    for level in range(min_level, max_level + 1):
+        data = load_json(manifest_dir / f"level-{level}.json")
+        if data.get("tiles") is None or data.get("tiles") != data.get("expected"):
+            raise UploaderError(f"DeepZoom seviyesi {level} tamamlanmamis.")
+        levels[str(level)] = {"tiles": data["tiles"], "bytes": data["bytes"], "digest": data["digest"]}
+    digest = hashlib.sha1(
+        "\n".join(f"{level} {levels[level]['digest']}" for level in sorted(levels, key=int)).encode("utf-8")
+    ).hexdigest()
+    index = {
+        "version": 1,
+        "complete": True,
+        "profile": profile["name"],
+        "format": info["format"],
+        "tile_size": info["tile_size"],
+        "overlap": info["overlap"],
+        "width": info["width"],
+        "height": info["height"],
+        "min_level": min_level,
+        "max_level": max_level,
+        "levels": levels,
+        "tiles": sum(item["tiles"] for item in levels.values()),
+        "bytes": sum(item["bytes"] for item in levels.values()),
+        "digest": digest,
+        "created_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+    }
+    # index.json is written last; its presence marks the conversion complete.
+    atomic_write_json(manifest_dir / "index.json", index)
+    return index
+
+
+def generate_deepzoom_atomic(job: SlideJob, stager: Optional[TileStager] = None) -> None:
     if deepzoom_complete(job.repo_path):
         say("DeepZoom zaten hazir; yeniden uretilmiyor.", repo=job.repo_name, stage="deepzoom", progress=30)
         return
-    pyvips = import_pyvips()
-    temp_root = LOCAL_REPO_BASE / f".{job.repo_name}.deepzoom_tmp"
-    safe_rmtree(temp_root)
-    temp_root.mkdir(parents=True, exist_ok=True)
-    say("DeepZoom uretiliyor...", repo=job.repo_name, stage="deepzoom", progress=20)
+    profile = deepzoom_profile(job.encoding_profile)
+    settings = deepzoom_settings(profile)
+    # The work directory survives failures: finished levels are checkpointed
+    # with a manifest and the next run continues from the first missing one.
+    work = LOCAL_REPO_BASE / f".{job.repo_name}.deepzoom_tmp"
+    signature = conversion_signature(job, settings)
+    if load_json(work / "conversion.json") != signature:
+        safe_rmtree(work)
+    work.mkdir(parents=True, exist_ok=True)
+    atomic_write_json(work / "conversion.json", signature)
+    completed = completed_manifest_levels(work / "manifest")
+    settings["completed_levels"] = sorted(completed)
+    if completed:
+        say(
+            f"Yarim kalan DeepZoom devam ediyor ({len(completed)} seviye hazir).",
+            repo=job.repo_name,
+            stage="deepzoom",
+            progress=20,
+        )
+    else:
+        say(f"DeepZoom uretiliyor ({profile['name']} profili)...", repo=job.repo_name, stage="deepzoom", progress=20)
+    on_levels = None
+    if stager is not None:
+        on_levels = functools.partial(stager.add_levels, work / "slide_files", work / "manifest")
     try:
-        image = pyvips.Image.new_from_file(str(job.svs_path), access="sequential")
-        image.dzsave(str(temp_root / "slide"))
-        del image
-        temp_dzi = temp_root / "slide.dzi"
-        temp_tiles = temp_root / "slide_files"
-        if not temp_dzi.exists() or not temp_tiles.exists() or not any(temp_tiles.iterdir()):
-            raise UploaderError("DeepZoom ciktilari eksik olustu.")
+        details = run_deepzoom_worker(job, work / "slide", settings, on_levels)
+        index = finalize_manifest(work, profile)
+        if stager is not None:
+            # Staged blobs are read from the work directory; finish before moving it.
+            stager.wait()
         clear_slide_payload(job.repo_path)
-        shutil.move(str(temp_dzi), str(job.repo_path / "slide.dzi"))
-        shutil.move(str(temp_tiles), str(job.repo_path / "slide_files"))
-        job.save_state(stage="deepzoom_ready", last_error="")
-        say("DeepZoom tamamlandi.", repo=job.repo_name, stage="deepzoom", progress=34)
+        shutil.move(str(work / "slide.dzi"), str(job.repo_path / "slide.dzi"))
+        shutil.move(str(work / "slide_files"), str(job.repo_path / "slide_files"))
+        shutil.move(str(work / "manifest"), str(job.repo_path / MANIFEST_DIR_NAME))
+        safe_rmtree(work)
+        job.save_state(
+            stage="deepzoom_ready",
+            last_error="",
+            deepzoom_profile=profile,
+            tissue=details.get("tissue") or {},
+            pyramid_mode=details.get("pyramid") or "full",
+            tile_count=index["tiles"],
+            tile_digest=index["digest"],
+        )
+        say(
+            f"DeepZoom tamamlandi ({index['tiles']} karo, {human_bytes(index['bytes'])}).",
+            repo=job.repo_name,
+            stage="deepzoom",
+            progress=34,
+        )
     except Exception as exc:
         job.save_state(stage="deepzoom_error", last_error=str(exc))
         raise UploaderError(f"SVS -> DeepZoom donusumu basarisiz: {exc}") from exc
-    finally:
-        safe_rmtree(temp_root)
 
 
 def _save_small_jpeg(image: Any, destination: Path) -> None:
@@ -860,21 +2334,37 @@ def _save_small_jpeg(image: Any, destination: Path) -> None:
         current.jpegsave(str(destination), Q=68, strip=True, optimize_coding=True)
 
 
+def _save_thumbnail_variants(image: Any, repo_path: Path) -> List[int]:
+    # Small copies for the gallery grid (srcset); thumbnail.jpg stays the largest one.
+    if getattr(image, "hasalpha", lambda: False)():
+        image = image.flatten(background=[255, 255, 255])
+    widths: List[int] = []
+    for width in THUMB_VARIANT_WIDTHS:
+        if int(image.width) <= width:
+            break
+        variant = image.resize(width / float(image.width))
+        variant.jpegsave(str(repo_path / f"thumbnail-{width}.jpg"), Q=78, strip=True, optimize_coding=True)
+        widths.append(width)
+    return widths
+
+
 def prepare_thumbnail(job: SlideJob) -> None:
     destination = job.repo_path / "thumbnail.jpg"
-    pyvips = import_pyvips()
     source = job.thumbnail_source
-    image = None
+    if source:
+        say("Secilen thumbnail kucultuluyor...", repo=job.repo_name, stage="thumbnail", progress=38)
+    else:
+        say("Thumbnail SVS'den otomatik uretiliyor...", repo=job.repo_name, stage="thumbnail", progress=38)
     try:
-        if source:
-            say("Secilen thumbnail kucultuluyor...", repo=job.repo_name, stage="thumbnail", progress=38)
-            image = pyvips.Image.thumbnail(str(source), THUMB_MAX_PX)
-        else:
-            say("Thumbnail SVS'den otomatik uretiliyor...", repo=job.repo_name, stage="thumbnail", progress=38)
-            image = pyvips.Image.thumbnail(str(job.svs_path), THUMB_MAX_PX)
-        _save_small_jpeg(image, destination)
+        size = run_vips_worker(
+            job,
+            _thumbnail_worker_main,
+            (str(job.svs_path), str(source) if source else "", str(job.repo_path), job.state.get("tissue") or {}),
+            lambda kind, value: None,
+            label="Thumbnail",
+        )
         say(
-            f"Thumbnail hazir: {human_bytes(destination.stat().st_size)}",
+            f"Thumbnail hazir: {human_bytes(int(size))}",
             repo=job.repo_name,
             stage="thumbnail",
             progress=41,
@@ -885,16 +2375,80 @@ def prepare_thumbnail(job: SlideJob) -> None:
                 destination.unlink()
             except OSError:
                 pass
+        if DEEPZOOM_CANCEL.is_set():
+            raise
         warn(f"Thumbnail uretilemedi; slayt yuklemesi devam edecek: {exc}", repo=job.repo_name)
-    finally:
-        image = None
-        release_vips_file_handles()
 
 
-def write_slide_files(job: SlideJob) -> None:
-    (job.repo_path / "index.html").write_text(
-        VIEWER_HTML.format(title=html.escape(job.slide_title)), encoding="utf-8"
+def viewer_tile_source(info: Optional[Dict[str, Any]], levels: List[int]) -> str:
+    if not info or not levels:
+        return '"slide.dzi"'
+    # Inline geometry spares the viewer a round trip for slide.dzi before the
+    # first tile. Profiles with depth=onetile have no levels below one tile;
+    # minLevel tells OpenSeadragon where the pyramid starts so it never
+    # requests them.
+    options = {
+        "width": info["width"],
+        "height": info["height"],
+        "tileSize": info["tile_size"],
+        "tileOverlap": info["overlap"],
+        "tilesUrl": "slide_files/",
+        "fileFormat": info["format"],
+        "minLevel": min(levels),
+        "maxLevel": max(levels),
+    }
+    return f"new OpenSeadragon.DziTileSource({json.dumps(options)})"
+
+
+def viewer_first_tile(info: Optional[Dict[str, Any]], levels: List[int]) -> Optional[str]:
+    """The single tile OpenSeadragon paints first: the deepest level that still fits one tile."""
+    if not info or not levels:
+        return None
+    top = max(levels)
+    single = [
+        level
+        for level in levels
+        if level_tile_grid(info["width"], info["height"], info["tile_size"], level, top) == (1, 1)
+    ]
+    return f"slide_files/{max(single) if single else min(levels)}/0_0.{info['format']}"
+
+
+def viewer_cache_version(repo_path: Path) -> str:
+    """Changes whenever slide.dzi or any tile changes; names the viewer's tile cache."""
+    digest = hashlib.sha1()
+    dzi = repo_path / "slide.dzi"
+    if dzi.exists():
+        digest.update(dzi.read_bytes())
+    manifest_dir = repo_path / MANIFEST_DIR_NAME
+    for path in sorted(manifest_dir.glob("level-*.json")) if manifest_dir.is_dir() else []:
+        digest.update(str(load_json(path).get("digest", "")).encode("ascii"))
+    return digest.hexdigest()[:12]
+
+
+def render_viewer_html(job: SlideJob) -> str:
+    info = read_dzi_info(job.repo_path / "slide.dzi")
+    tiles = job.repo_path / "slide_files"
+    levels = [int(p.name) for p in tiles.iterdir() if p.is_dir() and p.name.isdigit()] if tiles.is_dir() else []
+    first_tile = viewer_first_tile(info, levels)
+    osd_base = f"https://{GITHUB_USERNAME}.github.io/{GALLERY_REPO_NAME}/{OSD_ASSET_PATH}/" if VIEWER_SELF_HOST else OSD_CDN_BASE
+    if VIEWER_TILE_CACHE_BYTES:
+        service_worker = f'navigator.serviceWorker.register("sw.js?v={viewer_cache_version(job.repo_path)}&budget={VIEWER_TILE_CACHE_BYTES}");'
+    else:
+        service_worker = "navigator.serviceWorker.getRegistration().then(function (r) { if (r) { r.unregister(); } });"
+    return VIEWER_HTML.format(
+        title=html.escape(job.slide_title),
+        service_worker=service_worker,
+        preload=f'\n    <link rel="preload" as="image" href="{first_tile}">' if first_tile else "",
+        osd_base=osd_base,
+        cdn_base=OSD_CDN_BASE,
+        tile_source=viewer_tile_source(info, levels),
+        aspect=f"{info['width'] / info['height']:.6f}" if info and info["height"] else "0",
     )
+
+
+def write_slide_files(job: SlideJob) -> None:
+    (job.repo_path / "index.html").write_text(render_viewer_html(job), encoding="utf-8")
+    (job.repo_path / "sw.js").write_text(VIEWER_SERVICE_WORKER, encoding="utf-8")
     readme = f"# {job.slide_title}\n\n"
     if job.description:
         readme += job.description.strip() + "\n\n"
@@ -914,12 +2468,154 @@ def ensure_repo_size_safe(job: SlideJob) -> int:
     return size
 
 
-def commit_if_needed(job: SlideJob) -> bool:
+class TileStager:
+    """Writes finished DeepZoom levels into the repo object database during conversion.
+
+    Levels are hashed with `git hash-object -w` as soon as their manifest is
+    written, so the commit only has to point the index at existing blobs
+    instead of re-reading every tile with `git add`.
+    """
+
+    def __init__(self, job: SlideJob) -> None:
+        self.job = job
+        self.entries: Dict[str, str] = {}
+        self.error = ""
+        self._queue: "queue.Queue[Optional[Tuple[Path, Path, List[int]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def add_levels(self, tiles_dir: Path, manifest_dir: Path, levels: Iterable[int]) -> None:
+        if not GIT_STREAM_TILES:
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name=f"stage-{self.job.repo_name}", daemon=True)
+            self._thread.start()
+        self._queue.put((tiles_dir, manifest_dir, sorted(set(levels), reverse=True)))
+
+    def wait(self) -> None:
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            if self.error:
+                continue
+            try:
+                self._stage(*item)
+            except Exception as exc:
+                self.error = str(exc)
+                LOGGER.exception("Karolar git nesnelerine yazilamadi: %s", self.job.repo_name)
+
+    def _stage(self, tiles_dir: Path, manifest_dir: Path, levels: List[int]) -> None:
+        # Relative paths keep the stdin stream ASCII on every platform.
+        relative = Path(os.path.relpath(tiles_dir, self.job.repo_path)).as_posix()
+        for level in levels:
+            files = load_json(manifest_dir / f"level-{level}.json").get("files") or {}
+            if not files:
+                continue
+            names = sorted(files)
+            paths = "".join(f"{relative}/{level}/{name}\n" for name in names)
+            shas = git(["hash-object", "-w", "--no-filters", "--stdin-paths"], self.job.repo_path, input=paths).stdout.split()
+            if len(shas) != len(names):
+                raise UploaderError(f"Seviye {level}: {len(shas)}/{len(names)} karo git nesnesine yazildi.")
+            for name, sha in zip(names, shas):
+                if sha != files[name][0]:
+                    raise UploaderError(f"Seviye {level}: {name} manifest ile uyusmuyor.")
+                self.entries[f"slide_files/{level}/{name}"] = sha
+
+    def update_index(self) -> bool:
+        """Point the index at the pre-written tile blobs; False means fall back to `git add`."""
+        self.wait()
+        if self.error:
+            warn(f"Karolar onceden hazirlanamadi; git add kullaniliyor ({self.error}).", repo=self.job.repo_name, stage="repo")
+            return False
+        if not self.entries:
+            return False
+        lines = "".join(f"100644 {sha}\t{path}\n" for path, sha in self.entries.items())
+        git(["update-index", "--add", "--index-info"], self.job.repo_path, input=lines)
+        # Refresh only records stat data; it re-reads files but writes no objects.
+        git(["update-index", "-q", "--refresh"], self.job.repo_path, allow_failure=True)
+        return True
+
+
+def tile_level(path: str) -> int:
+    parts = path.split("/")
+    return int(parts[1]) if len(parts) > 2 and parts[1].isdigit() else -1
+
+
+def split_commit_for_push(job: SlideJob) -> List[str]:
+    """Rewrite HEAD as a chain of commits that each add at most PUSH_CHUNK_BYTES of tiles.
+
+    Tiles are added coarse level first; the last commit carries the remaining
+    files and has exactly the tree of the original commit.
+    """
+    repo = job.repo_path
+    head = git(["rev-parse", "HEAD"], repo).stdout.strip()
+    parent = git(["rev-parse", "--verify", "-q", "HEAD^"], repo, allow_failure=True).stdout.strip()
+    raw = git(["diff-tree", "-r", "-z", "--root", "--no-renames", "--no-commit-id", head], repo).stdout
+    fields = raw.split("\0")
+    tiles: List[Tuple[int, str, str, str, int]] = []
+    for meta, path in zip(fields[0::2], fields[1::2]):
+        parts = meta.split()
+        if len(parts) < 5 or parts[4] == "D" or not path.startswith("slide_files/"):
+            continue
+        target = repo / path
+        size = target.stat().st_size if target.exists() else 0
+        tiles.append((tile_level(path), path, parts[1], parts[3], size))
+    if not PUSH_CHUNK_BYTES or sum(item[4] for item in tiles) <= PUSH_CHUNK_BYTES:
+        return []
+    tiles.sort(key=lambda item: (item[0], item[1]))
+    groups: List[List[Tuple[int, str, str, str, int]]] = [[]]
+    used = 0
+    for item in tiles:
+        if groups[-1] and used + item[4] > PUSH_CHUNK_BYTES:
+            groups.append([])
+            used = 0
+        groups[-1].append(item)
+        used += item[4]
+    if len(groups) < 2:
+        return []
+    message = git(["log", "-1", "--format=%B"], repo).stdout.strip()
+    index_file = repo / ".git" / "chunk-index"
+    env = {**os.environ, "GIT_INDEX_FILE": str(index_file)}
+    try:
+        git(["read-tree", parent] if parent else ["read-tree", "--empty"], repo, env=env)
+        chunks: List[str] = []
+        previous = parent
+        total = len(groups)
+        for number, group in enumerate(groups[:-1], start=1):
+            lines = "".join(f"{mode} {sha}\t{path}\n" for _, path, mode, sha, _ in group)
+            git(["update-index", "--add", "--index-info"], repo, env=env, input=lines)
+            tree = git(["write-tree"], repo, env=env).stdout.strip()
+            args = ["commit-tree", tree, "-m", f"{message} (part {number}/{total})"]
+            if previous:
+                args += ["-p", previous]
+            previous = git(args, repo).stdout.strip()
+            chunks.append(previous)
+        final = git(["commit-tree", f"{head}^{{tree}}", "-p", previous, "-m", message], repo).stdout.strip()
+        chunks.append(final)
+    finally:
+        index_file.unlink(missing_ok=True)
+    git(["update-ref", "-m", "split for chunked push", "HEAD", final, head], repo)
+    return chunks
+
+
+def commit_if_needed(job: SlideJob, stager: Optional[TileStager] = None) -> bool:
+    if stager is not None and stager.update_index():
+        say(f"{len(stager.entries)} karo onceden git nesnesine yazildi.", repo=job.repo_name, stage="repo")
     git(["add", "-A"], job.repo_path)
     status = git(["status", "--porcelain"], job.repo_path).stdout.strip()
     if not status:
         return False
     git(["commit", "-m", f"Slide added/updated: {job.slide_title}"], job.repo_path)
+    chunks = split_commit_for_push(job)
+    if chunks:
+        say(f"Yukleme {len(chunks)} parcali commit olarak hazirlandi.", repo=job.repo_name, stage="repo")
+    job.save_state(push_chunks=chunks, pushed_chunks=0)
     return True
 
 
@@ -953,66 +2649,354 @@ def create_remote_repo(job: SlideJob) -> dict:
         raise
 
 
-def ensure_pages(repo_name: str, branch: str) -> None:
-    path = f"/repos/{GITHUB_USERNAME}/{repo_name}/pages"
-    current = api_request("GET", path, expected=(200, 404))
-    payload = {"source": {"branch": branch, "path": "/"}}
-    if current.status_code == 200:
-        api_request("PUT", path, expected=(200, 204), json=payload)
-        return
-    response = api_request("POST", path, expected=(201, 409, 422), json=payload)
-    if response.status_code == 422:
-        # Often means Pages is already being configured. A later verification decides success.
-        warn(f"Pages ayari 422 dondurdu; canli sayfa kontrolu ile devam edilecek: {_response_message(response)}", repo=repo_name)
+def ensure_pages(repo_name: str, branch: str) -> None:
+    path = f"/repos/{GITHUB_USERNAME}/{repo_name}/pages"
+    current = api_request("GET", path, expected=(200, 404))
+    payload = {"source": {"branch": branch, "path": "/"}}
+    if current.status_code == 200:
+        api_request("PUT", path, expected=(200, 204), json=payload)
+        return
+    response = api_request("POST", path, expected=(201, 409, 422), json=payload)
+    if response.status_code == 422:
+        # Often means Pages is already being configured. A later verification decides success.
+        warn(f"Pages ayari 422 dondurdu; canli sayfa kontrolu ile devam edilecek: {_response_message(response)}", repo=repo_name)
+
+
+def latest_pages_build(repo_name: str) -> Tuple[Optional[str], str, str]:
+    """Status, error message and commit SHA of the most recent Pages build."""
+    response = api_request(
+        "GET",
+        f"/repos/{GITHUB_USERNAME}/{repo_name}/pages/builds/latest",
+        expected=(200, 404),
+        retries=2,
+    )
+    if response.status_code != 200:
+        return None, "", ""
+    data = response.json()
+    error = data.get("error") or {}
+    return data.get("status"), str(error.get("message") or ""), str(data.get("commit") or "")
+
+
+# Pages probes reuse keep-alive connections to *.github.io instead of a new
+# TCP+TLS handshake per poll; the pool covers every parallel verifier.
+PUBLIC_SESSION = requests.Session()
+PUBLIC_SESSION.headers.update({"Cache-Control": "no-cache", "User-Agent": "whole-slide-uploader-live-check"})
+_public_adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=PIPELINE_VERIFY_WORKERS + FANOUT_WORKERS + max(CDN_WARMUP_WORKERS, PAGES_TILE_WORKERS))
+PUBLIC_SESSION.mount("https://", _public_adapter)
+PUBLIC_SESSION.mount("http://", _public_adapter)
+PUBLIC_STATS_LOCK = threading.Lock()
+PUBLIC_STATS: Dict[str, float] = {"requests": 0, "seconds": 0.0, "slowest": 0.0}
+
+
+def public_request(method: str, url: str, *, timeout: int = 20, headers: Optional[dict] = None) -> requests.Response:
+    started = time.monotonic()
+    response = PUBLIC_SESSION.request(method, url, headers=headers, timeout=timeout, allow_redirects=True)
+    elapsed = time.monotonic() - started
+    with PUBLIC_STATS_LOCK:
+        PUBLIC_STATS["requests"] += 1
+        PUBLIC_STATS["seconds"] += elapsed
+        PUBLIC_STATS["slowest"] = max(PUBLIC_STATS["slowest"], elapsed)
+    LOGGER.debug("%s %s -> %s (%.0f ms)", method, url, response.status_code, elapsed * 1000)
+    return response
+
+
+def public_get(url: str, *, timeout: int = 20) -> requests.Response:
+    return public_request("GET", url, timeout=timeout)
+
+
+def public_exists(url: str, *, timeout: int = 20) -> bool:
+    return public_request("HEAD", url, timeout=timeout).status_code == 200
+
+
+def public_head_text(url: str, limit: int = 1200, *, timeout: int = 20) -> Tuple[int, str]:
+    """Fetch only the first bytes of a file; 206 from a Range request counts as 200."""
+    response = public_request("GET", url, timeout=timeout, headers={"Range": f"bytes=0-{limit - 1}"})
+    status = 200 if response.status_code == 206 else response.status_code
+    return status, response.text[:limit]
+
+
+def public_timing_summary() -> str:
+    with PUBLIC_STATS_LOCK:
+        count = int(PUBLIC_STATS["requests"])
+        average = PUBLIC_STATS["seconds"] / count * 1000 if count else 0.0
+        slowest = PUBLIC_STATS["slowest"] * 1000
+    return f"Pages kontrolleri: {count} istek, ortalama {average:.0f} ms, en yavas {slowest:.0f} ms"
+
+
+class PagesVerifier:
+    """Verifies many Pages sites from one shared loop that follows each build.
+
+    While a build is missing, queued or building only the builds API is
+    polled, with a growing interval. Once it reports built, the public URLs
+    are probed quickly until the CDN serves the new site.
+    """
+
+    def __init__(self) -> None:
+        self.condition = threading.Condition()
+        self.pending: Dict[str, Dict[str, Any]] = {}
+        self.thread: Optional[threading.Thread] = None
+
+    def verify(self, job: SlideJob, timeout: int) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "job": job,
+            "deadline": time.monotonic() + timeout,
+            "next": 0.0,
+            "phase": "build",
+            "delay": 0.0,
+            "ok": False,
+            "error": "",
+            "last": "",
+            "head": git(["rev-parse", "HEAD"], job.repo_path, allow_failure=True).stdout.strip() if job.repo_path.is_dir() else "",
+            "done": threading.Event(),
+        }
+        with self.condition:
+            self.pending[job.repo_name] = entry
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="pages-verifier", daemon=True)
+                self.thread.start()
+            self.condition.notify_all()
+        entry["done"].wait()
+        return entry
+
+    def _run(self) -> None:
+        while True:
+            with self.condition:
+                if not self.pending:
+                    self.thread = None
+                    return
+                now = time.monotonic()
+                due = [entry for entry in self.pending.values() if entry["next"] <= now]
+                if not due:
+                    self.condition.wait(min(entry["next"] for entry in self.pending.values()) - now)
+                    continue
+            for entry in due:
+                try:
+                    finished = self._step(entry)
+                except Exception as exc:
+                    entry["last"] = str(exc)
+                    entry["next"] = time.monotonic() + 7
+                    finished = False
+                if finished or time.monotonic() > entry["deadline"]:
+                    with self.condition:
+                        self.pending.pop(entry["job"].repo_name, None)
+                    entry["done"].set()
+
+    def _step(self, entry: Dict[str, Any]) -> bool:
+        job: SlideJob = entry["job"]
+        if entry["phase"] == "build":
+            status, build_error, commit = latest_pages_build(job.repo_name)
+            if entry["head"] and commit and commit != entry["head"]:
+                # The latest build is of an older commit; ours has not been
+                # picked up yet, whatever that build's outcome was.
+                entry["last"] = f"build={commit[:7]}, beklenen={entry['head'][:7]}"
+                entry["delay"] = min(30.0, max(5.0, entry["delay"] * 2))
+                entry["next"] = time.monotonic() + entry["delay"]
+                return False
+            if status in {"errored", "error"}:
+                entry["error"] = f"GitHub Pages build hatasi: {build_error or status}"
+                return True
+            if status == "built":
+                entry["phase"], entry["delay"] = "cdn", 0.0
+                say("Pages build tamamlandi; yayin kontrol ediliyor.", repo=job.repo_name, stage="pages", progress=80)
+            elif status == "building":
+                entry["last"], entry["delay"] = "build=building", 5.0
+                entry["next"] = time.monotonic() + entry["delay"]
+                return False
+            else:
+                # Queued or not started yet: nothing public can change, so back off.
+                entry["last"] = f"build={status or 'yok'}"
+                entry["delay"] = min(30.0, max(5.0, entry["delay"] * 2))
+                entry["next"] = time.monotonic() + entry["delay"]
+                if status is not None:
+                    return False
+        stamp = int(time.time())
+        page = public_exists(job.web_url + f"?v={stamp}", timeout=15)
+        dzi_status, dzi_text = public_head_text(job.web_url + f"slide.dzi?v={stamp}", timeout=15)
+        if page and dzi_status == 200 and "<Image" in dzi_text:
+            entry["ok"] = True
+            return True
+        entry["last"] = f"page={'200' if page else 'yok'}, dzi={dzi_status}, build={entry['phase']}"
+        if entry["phase"] == "cdn":
+            # Right after a build the CDN usually catches up within seconds.
+            entry["delay"] = min(8.0, entry["delay"] + 2.0)
+            entry["next"] = time.monotonic() + entry["delay"]
+        return False
+
+
+PAGES_VERIFIER = PagesVerifier()
 
 
-def latest_pages_build(repo_name: str) -> Tuple[Optional[str], str]:
-    response = api_request(
-        "GET",
-        f"/repos/{GITHUB_USERNAME}/{repo_name}/pages/builds/latest",
-        expected=(200, 404),
-        retries=2,
-    )
-    if response.status_code != 200:
-        return None, ""
-    data = response.json()
-    error = data.get("error") or {}
-    return data.get("status"), str(error.get("message") or "")
+def slide_tile_grids(repo_path: Path) -> Tuple[Optional[Dict[str, Any]], Dict[int, Tuple[int, int]]]:
+    """DZI geometry and the tile grid of every level present in the local repo."""
+    info = read_dzi_info(repo_path / "slide.dzi")
+    if not info:
+        return None, {}
+    tiles = repo_path / "slide_files"
+    levels = sorted(int(p.name) for p in tiles.iterdir() if p.is_dir() and p.name.isdigit()) if tiles.is_dir() else []
+    levels = levels or list(range((max(info["width"], info["height"]) - 1).bit_length() + 1))
+    top = max(levels)
+    return info, {level: level_tile_grid(info["width"], info["height"], info["tile_size"], level, top) for level in levels}
 
 
-def public_get(url: str, *, timeout: int = 20) -> requests.Response:
-    headers = {"Cache-Control": "no-cache", "User-Agent": "whole-slide-uploader-live-check"}
-    return requests.get(url, headers=headers, timeout=timeout)
+def tile_path(info: Dict[str, Any], grids: Dict[int, Tuple[int, int]], level: int, index: int) -> str:
+    columns = grids[level][0]
+    return f"slide_files/{level}/{index % columns}_{index // columns}.{info['format']}"
+
+
+def verify_tile_sample(
+    repo_path: Path,
+    web_url: str,
+    repo_name: str,
+    *,
+    workers: int = PAGES_TILE_WORKERS,
+    sample: int = PAGES_TILE_SAMPLE,
+) -> Tuple[int, List[str]]:
+    """HEAD-probe `sample` random tiles of every level; returns (checked, missing).
+
+    Tiles that fail are retried twice a few seconds apart, since the CDN can
+    lag the origin by a moment right after a build.
+    """
+    info, grids = slide_tile_grids(repo_path)
+    if not info or not sample:
+        return 0, []
+    sampler = random.Random()
+    paths: List[str] = []
+    for level, (columns, rows) in sorted(grids.items()):
+        count = columns * rows
+        paths.extend(tile_path(info, grids, level, index) for index in sorted(sampler.sample(range(count), min(count, sample))))
+
+    def probe(path: str) -> bool:
+        try:
+            return public_exists(web_url + path, timeout=10)
+        except requests.RequestException:
+            return False
+
+    missing = paths
+    for attempt in range(3):
+        if attempt:
+            time.sleep(5 * attempt)
+        found = map_concurrent(probe, missing, label=f"{repo_name} karo dogrulamasi", stage="pages", workers=workers, unit="karo")
+        missing = [path for path, ok in zip(missing, found) if not ok]
+        if not missing:
+            break
+    return len(paths), missing
+
+
+def recorded_tile_sample(repo_path: Path) -> str:
+    """HEAD SHA for which a full tile sample last passed, from the repo marker."""
+    return str(load_json(repo_path / MARKER_NAME).get("tile_sample_sha") or "")
+
+
+def _record_marker_sha(repo_path: Path, key: str, sha: str) -> None:
+    # Checks that depend only on a commit are remembered in the repo marker.
+    marker = repo_path / MARKER_NAME
+    if sha and marker.exists():
+        data = load_json(marker)
+        data[key] = sha
+        atomic_write_json(marker, data)
+
+
+def record_tile_sample(repo_path: Path, sha: str) -> None:
+    _record_marker_sha(repo_path, "tile_sample_sha", sha)
 
 
 def wait_for_pages_live(job: SlideJob, timeout: Optional[int] = None) -> None:
     timeout = timeout or PAGES_VERIFY_TIMEOUT
-    deadline = time.monotonic() + timeout
-    last = ""
     say("GitHub Pages canli yayin bekleniyor...", repo=job.repo_name, stage="pages", progress=76)
-    while time.monotonic() < deadline:
-        try:
-            status, build_error = latest_pages_build(job.repo_name)
-            if status in {"errored", "error"}:
-                raise UploaderError(f"GitHub Pages build hatasi: {build_error or status}")
-            stamp = int(time.time())
-            page = public_get(job.web_url + f"?v={stamp}", timeout=15)
-            dzi = public_get(job.web_url + f"slide.dzi?v={stamp}", timeout=15)
-            if page.status_code == 200 and dzi.status_code == 200 and "<Image" in dzi.text[:1200]:
-                job.save_state(stage="pages_live", pages_verified=True, last_error="")
-                say("Web sayfasi ve slide.dzi canli olarak dogrulandi.", repo=job.repo_name, stage="pages", progress=86)
-                return
-            last = f"page={page.status_code}, dzi={dzi.status_code}, build={status or 'unknown'}"
-        except UploaderError:
-            raise
-        except Exception as exc:
-            last = str(exc)
-        time.sleep(7)
+    result = PAGES_VERIFIER.verify(job, timeout)
+    if result["ok"]:
+        checked, missing = verify_tile_sample(job.repo_path, job.web_url, job.repo_name)
+        if missing:
+            detail = f"{len(missing)}/{checked} ornek karo yayinda yok (ornek: {missing[0]})"
+            job.save_state(stage="pages_wait", pages_verified=False, last_error=detail)
+            raise UploaderError(f"Pages eksik yayinlanmis: {detail}. Sonraki calistirmada buradan devam eder.")
+        if checked:
+            say(
+                f"{checked} ornek karo yayinda (%{PAGES_TILE_CONFIDENCE * 100:g} guvenle eksik oran < %{PAGES_TILE_MISSING * 100:g}).",
+                repo=job.repo_name,
+                stage="pages",
+                progress=85,
+            )
+            record_tile_sample(job.repo_path, result["head"])
+        job.save_state(stage="pages_live", pages_verified=True, last_error="")
+        say("Web sayfasi ve slide.dzi canli olarak dogrulandi.", repo=job.repo_name, stage="pages", progress=86)
+        return
+    if result["error"]:
+        raise UploaderError(result["error"])
+    last = result["last"]
     job.save_state(stage="pages_wait", pages_verified=False, last_error=f"Canli yayin henuz dogrulanamadi: {last}")
     raise UploaderError(f"Pages {timeout} saniye icinde dogrulanamadi ({last}). Sonraki calistirmada buradan devam eder.")
 
 
-def process_slide_upload(job: SlideJob) -> SlideJob:
+def warmup_tile_paths(job: SlideJob, budget: int) -> List[str]:
+    """Every tile of the coarsest levels (half the budget), then an even random sample of the rest."""
+    info, grids = slide_tile_grids(job.repo_path)
+    if not info or budget <= 0:
+        return []
+    paths: List[str] = []
+    remaining = sorted(grids)
+    while remaining and len(paths) + grids[remaining[0]][0] * grids[remaining[0]][1] <= budget // 2:
+        level = remaining.pop(0)
+        paths.extend(tile_path(info, grids, level, index) for index in range(grids[level][0] * grids[level][1]))
+    sampler = random.Random(job.repo_name)
+    for position, level in enumerate(remaining):
+        share = (budget - len(paths)) // (len(remaining) - position)
+        count = grids[level][0] * grids[level][1]
+        paths.extend(tile_path(info, grids, level, index) for index in sorted(sampler.sample(range(count), min(share, count))))
+    return paths
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def warm_pages_cache(job: SlideJob) -> None:
+    """Request the tiles a first viewer needs so the nearest CDN edge already holds them.
+
+    Run right after the live check: slides are often opened in class minutes
+    after upload, and the classroom usually sits behind the same edge as the
+    uploader. Failures are only reported; the slide is already published.
+    """
+    paths = warmup_tile_paths(job, CDN_WARMUP_TILES)
+    if not paths:
+        return
+    say(f"CDN isitiliyor: {len(paths)} karo...", repo=job.repo_name, stage="warmup", progress=87)
+
+    def fetch(path: str) -> Tuple[int, float, str]:
+        started = time.monotonic()
+        try:
+            # No "Cache-Control: no-cache" here: the request must be cacheable
+            # exactly like a viewer's.
+            response = public_request("GET", job.web_url + path, timeout=20, headers={"Cache-Control": None})
+        except requests.RequestException:
+            return 0, time.monotonic() - started, ""
+        return response.status_code, time.monotonic() - started, response.headers.get("X-Cache", "")
+
+    results = map_concurrent(fetch, paths, label="CDN isitma", stage="warmup", workers=CDN_WARMUP_WORKERS, unit="karo")
+    ok = [(elapsed, cache) for status, elapsed, cache in results if status == 200]
+    hits = sum(1 for _, cache in ok if "HIT" in cache.upper())
+    latencies = [elapsed * 1000 for elapsed, _ in ok]
+    summary = {
+        "tiles": len(paths),
+        "ok": len(ok),
+        "hits": hits,
+        "misses": len(ok) - hits,
+        "p50_ms": round(_percentile(latencies, 0.5)) if latencies else None,
+        "p90_ms": round(_percentile(latencies, 0.9)) if latencies else None,
+        "p99_ms": round(_percentile(latencies, 0.99)) if latencies else None,
+    }
+    job.save_state(warmup=summary)
+    message = (
+        f"CDN isitildi: {len(ok)}/{len(paths)} karo, {hits} onbellekte, {len(ok) - hits} yeni; "
+        f"p50 {summary['p50_ms']} ms, p90 {summary['p90_ms']} ms, p99 {summary['p99_ms']} ms"
+        if latencies
+        else f"CDN isitma: {len(paths)} karonun hicbiri alinamadi."
+    )
+    emit("info" if latencies else "warning", message, repo=job.repo_name, stage="warmup", progress=88, warmup=summary)
+
+
+def convert_slide_stage(job: SlideJob) -> bool:
     job.reload_state()
     if not job.prepared:
         raise UploaderError("Slayt hazirligi tamamlanmamis.")
@@ -1022,31 +3006,56 @@ def process_slide_upload(job: SlideJob) -> SlideJob:
 
     if job.state.get("pages_verified") and remote_info:
         say("Slayt daha once web'de dogrulanmis; tekrar yuklenmiyor.", repo=job.repo_name, stage="pages", progress=86)
-        return job
+        return False
 
     if job.state.get("pushed") and remote_info:
-        ensure_pages(job.repo_name, job.branch)
-        wait_for_pages_live(job)
-        return job
-
-    branch = prepare_local_repo(job, remote_info)
-    generate_deepzoom_atomic(job)
-    prepare_thumbnail(job)
-    write_slide_files(job)
-    size = ensure_repo_size_safe(job)
-    say(f"Repo yayin icerigi: {human_bytes(size)}", repo=job.repo_name, stage="repo", progress=44)
-    commit_if_needed(job)
-
-    if remote_info is None:
-        remote_info = create_remote_repo(job)
-    authenticated_git_push(job.repo_path, branch, job.repo_name)
-    job.save_state(stage="pushed", pushed=True, last_error="")
-    say("GitHub push tamamlandi.", repo=job.repo_name, stage="push", progress=66)
-
-    ensure_pages(job.repo_name, branch)
+        return True
+
+    prepare_local_repo(job, remote_info)
+    stager = TileStager(job)
+    try:
+        generate_deepzoom_atomic(job, stager)
+        prepare_thumbnail(job)
+        write_slide_files(job)
+        size = ensure_repo_size_safe(job)
+        say(f"Repo yayin icerigi: {human_bytes(size)}", repo=job.repo_name, stage="repo", progress=44)
+        commit_if_needed(job, stager)
+    finally:
+        stager.wait()
+    job.save_state(stage="committed")
+    return True
+
+
+def publish_slide_stage(job: SlideJob) -> bool:
+    remote_info = github_repo(job.repo_name)
+    if not (job.state.get("pushed") and remote_info):
+        if remote_info is None:
+            remote_info = create_remote_repo(job)
+        authenticated_git_push(
+            job.repo_path,
+            job.branch,
+            job.repo_name,
+            job.state.get("push_chunks") or [],
+            int(job.state.get("pushed_chunks") or 0),
+            lambda count: job.save_state(pushed_chunks=count),
+        )
+        job.save_state(stage="pushed", pushed=True, last_error="")
+        say("GitHub push tamamlandi.", repo=job.repo_name, stage="push", progress=66)
+    ensure_pages(job.repo_name, job.branch)
     job.save_state(stage="pages_configured")
+    return True
+
+
+def verify_slide_stage(job: SlideJob) -> bool:
     wait_for_pages_live(job)
-    return job
+    if CDN_WARMUP_TILES:
+        try:
+            warm_pages_cache(job)
+        except Exception as exc:
+            LOGGER.exception("CDN warm-up failed: %s", job.repo_name)
+            warn(f"CDN isitma yapilamadi; slayt yayinda: {exc}", repo=job.repo_name, stage="warmup")
+    return True
+
 
 # -----------------------------------------------------------------------------
 # Gallery synchronization
@@ -1090,11 +3099,99 @@ def put_repo_text_file(repo_name: str, file_path: str, content: str, message: st
         raise
 
 
-def read_slide_metadata(repo_name: str) -> Tuple[str, str, bool]:
+def commit_repo_files(
+    repo_name: str,
+    branch: str,
+    files: Dict[str, Union[str, bytes]],
+    message: str,
+    *,
+    prune: Optional[str] = None,
+) -> bool:
+    """Write several files in one commit with the Git Data API.
+
+    Text is sent inline in the tree; bytes are uploaded as blobs first. Files
+    under the ``prune`` directory that are not in ``files`` are deleted. The
+    branch head read at the start is the commit's parent, and the ref is
+    moved without force, so a concurrent update makes GitHub reject the ref
+    change and the whole commit is rebuilt on the new head. Returns False when
+    every file already has the wanted content.
+    """
+    base = f"/repos/{GITHUB_USERNAME}/{repo_name}"
+    for attempt in range(1, 4):
+        head = api_request("GET", f"{base}/commits/{branch}", expected=(200, 404, 409))
+        if head.status_code != 200:
+            # Empty repository: the Git Data API needs an existing commit, so
+            # the text files create one and binary files follow on the next pass.
+            for path, content in files.items():
+                if isinstance(content, str):
+                    put_repo_text_file(repo_name, path, content, message)
+            if all(isinstance(content, str) for content in files.values()):
+                return True
+            continue
+        parent = head.json()["sha"]
+        base_tree = head.json()["commit"]["tree"]["sha"]
+        current = {
+            item["path"]: item["sha"]
+            for item in api_request("GET", f"{base}/git/trees/{base_tree}?recursive=1").json().get("tree", [])
+            if item.get("type") == "blob"
+        }
+        changed = {
+            path: content
+            for path, content in files.items()
+            if current.get(path) != git_blob_sha(content.encode("utf-8") if isinstance(content, str) else content)
+        }
+        stale = [
+            path for path in current if prune and path.startswith(prune.rstrip("/") + "/") and path not in files
+        ]
+        if not changed and not stale:
+            return False
+        entries: List[dict] = []
+        for path, content in changed.items():
+            if isinstance(content, str):
+                entries.append({"path": path, "mode": "100644", "type": "blob", "content": content})
+                continue
+            blob = api_request(
+                "POST",
+                f"{base}/git/blobs",
+                expected=(201,),
+                json={"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"},
+            ).json()["sha"]
+            entries.append({"path": path, "mode": "100644", "type": "blob", "sha": blob})
+        entries.extend({"path": path, "mode": "100644", "type": "blob", "sha": None} for path in stale)
+        tree = api_request(
+            "POST",
+            f"{base}/git/trees",
+            expected=(201,),
+            json={"base_tree": base_tree, "tree": entries},
+        ).json()["sha"]
+        commit = api_request(
+            "POST",
+            f"{base}/git/commits",
+            expected=(201,),
+            json={"message": message, "tree": tree, "parents": [parent]},
+        ).json()["sha"]
+        try:
+            response = api_request(
+                "PATCH",
+                f"{base}/git/refs/heads/{branch}",
+                expected=(200, 409, 422),
+                json={"sha": commit, "force": False},
+            )
+        except UploaderError:
+            # If the response was lost, the ref may already point at our commit.
+            if remote_branch_sha(repo_name, branch) == commit:
+                return True
+            raise
+        if response.status_code == 200:
+            return True
+        LOGGER.info("%s dali degisti; galeri commit'i yeniden hazirlaniyor (%s/3)", repo_name, attempt)
+    raise UploaderError(f"{repo_name} dali guncellenemedi: ayni anda baska bir degisiklik yapiliyor.")
+
+
+def parse_slide_readme(repo_name: str, readme: Optional[str]) -> Tuple[str, str, bool]:
     title = repo_name
     description = "Whole slide image"
     has_thumbnail = False
-    readme, _ = get_repo_text_file(repo_name, "README.md")
     if readme:
         lines = [line.strip() for line in readme.splitlines()]
         for line in lines:
@@ -1118,6 +3215,15 @@ def read_slide_metadata(repo_name: str) -> Tuple[str, str, bool]:
             description = paragraphs[0]
         if "thumbnail.jpg" in readme:
             has_thumbnail = True
+    return title, description, has_thumbnail
+
+
+SlideMetadata = Tuple[str, str, bool, List[int]]
+
+
+def read_slide_metadata(repo_name: str) -> SlideMetadata:
+    readme, _ = get_repo_text_file(repo_name, "README.md")
+    title, description, has_thumbnail = parse_slide_readme(repo_name, readme)
     if not has_thumbnail:
         response = api_request(
             "GET",
@@ -1126,25 +3232,112 @@ def read_slide_metadata(repo_name: str) -> Tuple[str, str, bool]:
             retries=2,
         )
         has_thumbnail = response.status_code == 200
-    return title, description, has_thumbnail
+    # Variant sizes are only known from the batched GraphQL lookup.
+    return title, description, has_thumbnail, []
+
+
+GRAPHQL_BATCH_SIZE = 50
+
+
+def fetch_slide_metadata_batch(repo_names: Sequence[str]) -> Dict[str, SlideMetadata]:
+    """Read README and thumbnail presence for many slide repos with a few GraphQL queries.
+
+    Repos missing from the result (errors, partial responses) are left for
+    read_slide_metadata to fetch over REST.
+    """
+    metadata: Dict[str, SlideMetadata] = {}
+    names = list(repo_names)
+    variants = "".join(
+        f' t{width}: object(expression: "HEAD:thumbnail-{width}.jpg") {{ ... on Blob {{ oid }} }}'
+        for width in THUMB_VARIANT_WIDTHS
+    )
+    for start in range(0, len(names), GRAPHQL_BATCH_SIZE):
+        batch = names[start:start + GRAPHQL_BATCH_SIZE]
+        fields = "\n".join(
+            f"r{index}: repository(owner: $owner, name: $n{index}) {{"
+            " defaultBranchRef { name }"
+            ' readme: object(expression: "HEAD:README.md") { ... on Blob { text } }'
+            ' thumbnail: object(expression: "HEAD:thumbnail.jpg") { ... on Blob { oid } }'
+            f"{variants} }}"
+            for index in range(len(batch))
+        )
+        params = ", ".join(f"$n{index}: String!" for index in range(len(batch)))
+        variables: Dict[str, Any] = {"owner": GITHUB_USERNAME}
+        variables.update({f"n{index}": name for index, name in enumerate(batch)})
+        try:
+            response = api_request(
+                "POST",
+                "/graphql",
+                json={"query": f"query($owner: String!, {params}) {{\n{fields}\n}}", "variables": variables},
+            )
+            data = response.json().get("data") or {}
+        except Exception as exc:
+            LOGGER.warning("GraphQL metadata sorgusu basarisiz: %s", exc)
+            continue
+        for index, name in enumerate(batch):
+            repo = data.get(f"r{index}")
+            if not repo or not repo.get("defaultBranchRef"):
+                continue
+            readme = (repo.get("readme") or {}).get("text")
+            title, description, has_thumbnail = parse_slide_readme(name, readme)
+            widths = [width for width in THUMB_VARIANT_WIDTHS if repo.get(f"t{width}")]
+            metadata[name] = (title, description, has_thumbnail or bool(repo.get("thumbnail")), widths)
+    return metadata
+
+
+def gallery_slide(repo_name: str, metadata: Optional[SlideMetadata] = None) -> dict:
+    title, description, has_thumbnail, widths = metadata or read_slide_metadata(repo_name)
+    return {
+        "repo": repo_name,
+        "title": title,
+        "description": description,
+        "thumbnail": "thumbnail.jpg" if has_thumbnail else "",
+        "thumbnail_widths": list(widths) if has_thumbnail else [],
+    }
 
 
-def make_gallery_entry(repo_name: str) -> str:
-    title, description, has_thumbnail = read_slide_metadata(repo_name)
-    pages_link = f"https://{GITHUB_USERNAME}.github.io/{repo_name}/"
+def render_gallery_entry(slide: dict, *, hidden: bool = False, atlas: Optional[dict] = None) -> str:
+    pages_link = f"https://{GITHUB_USERNAME}.github.io/{slide['repo']}/"
     thumbnail = ""
-    if has_thumbnail:
+    if atlas:
+        style = (
+            f"background-image:url({atlas['url']});background-size:{atlas['size']};"
+            f"background-position:{atlas['position']}"
+        )
+        thumbnail = f'<span class="thumb" role="img" aria-label="Thumbnail" style="{html.escape(style, quote=True)}"></span>'
+    elif slide.get("thumbnail"):
+        full = pages_link + slide["thumbnail"]
+        widths = sorted(slide.get("thumbnail_widths") or [])
+        sources = [(f"{pages_link}thumbnail-{width}.jpg", width) for width in widths] + [(full, THUMB_MAX_PX)]
+        src = next((url for url, width in sources if width >= 480), full)
+        srcset = ", ".join(f"{url} {width}w" for url, width in sources)
         thumbnail = (
-            f'<img src="{pages_link}thumbnail.jpg" alt="Thumbnail" '
-            'class="w-full h-64 object-contain rounded-lg mb-4">'
+            f'<img src="{html.escape(src, quote=True)}" srcset="{html.escape(srcset, quote=True)}" '
+            'sizes="(min-width: 1024px) 30vw, (min-width: 640px) 45vw, 90vw" '
+            'loading="lazy" decoding="async" alt="Thumbnail">'
         )
     return (
-        '<li class="gallery-item bg-white p-6 rounded-xl shadow-lg">'
-        f'<a href="{html.escape(pages_link, quote=True)}" class="block"><div>'
-        f'{thumbnail}<h2 class="text-xl font-semibold text-blue-600 hover:underline">'
-        f'{html.escape(title)}</h2>'
-        f'<p class="text-gray-600 mt-2 text-sm">{html.escape(description)}</p>'
-        '</div></a></li>'
+        f'<li class="gallery-item" data-repo="{html.escape(slide["repo"], quote=True)}"{" hidden" if hidden else ""}>'
+        f'<a href="{html.escape(pages_link, quote=True)}">'
+        f'{thumbnail}<h2>{html.escape(slide["title"])}</h2>'
+        f'<p>{html.escape(slide["description"])}</p>'
+        '</a></li>'
+    )
+
+
+def render_gallery_readme(manifest: dict) -> str:
+    lines = [
+        f"- [**{slide['title']}**](https://{GITHUB_USERNAME}.github.io/{slide['repo']}/) - {slide['description']}"
+        for slide in manifest["slides"]
+    ]
+    return (
+        f"# {manifest['title']}\n\n"
+        + (manifest["description"] + "\n\n" if manifest["description"] else "")
+        + f"Live gallery: https://{GITHUB_USERNAME}.github.io/{GALLERY_REPO_NAME}/\n\n"
+        + "## Slides Overview\n\n"
+        + ("\n\n".join(lines) if lines else "No slides found.")
+        + "\n\n---\n"
+        + f"Updated automatically on {manifest['updated_at']}.\n"
     )
 
 
@@ -1157,22 +3350,357 @@ def repo_name_from_entry(entry: str) -> Optional[str]:
     return match.group(1) if match else None
 
 
-def entry_to_markdown(entry: str) -> str:
-    repo = repo_name_from_entry(entry)
-    if not repo:
-        return ""
-    link = f"https://{GITHUB_USERNAME}.github.io/{repo}/"
-    title_match = re.search(r"<h2\b[^>]*>(.*?)</h2>", entry, flags=re.DOTALL | re.IGNORECASE)
-    desc_match = re.search(r"<p\b[^>]*>(.*?)</p>", entry, flags=re.DOTALL | re.IGNORECASE)
-    title = re.sub(r"<[^>]+>", "", title_match.group(1)).strip() if title_match else repo
-    desc = re.sub(r"<[^>]+>", "", desc_match.group(1)).strip() if desc_match else "Whole slide image"
-    return f"- [**{html.unescape(title)}**]({link}) - {html.unescape(desc)}"
+def legacy_gallery_manifest(index_html: str, readme: str) -> dict:
+    """Build a manifest from a gallery page written before gallery.json existed."""
+    title, description = parse_gallery_settings(index_html, readme)
+    slides: List[dict] = []
+    seen: Set[str] = set()
+    for entry in re.findall(r"<li\b[^>]*>.*?</li>", index_html, flags=re.DOTALL | re.IGNORECASE):
+        repo = repo_name_from_entry(entry)
+        if not repo or repo in seen:
+            continue
+        seen.add(repo)
+        title_match = re.search(r"<h2\b[^>]*>(.*?)</h2>", entry, flags=re.DOTALL | re.IGNORECASE)
+        desc_match = re.search(r"<p\b[^>]*>(.*?)</p>", entry, flags=re.DOTALL | re.IGNORECASE)
+        slides.append(
+            {
+                "repo": repo,
+                "title": html.unescape(re.sub(r"<[^>]+>", "", title_match.group(1))).strip() if title_match else repo,
+                "description": html.unescape(re.sub(r"<[^>]+>", "", desc_match.group(1))).strip() if desc_match else "Whole slide image",
+                "thumbnail": "thumbnail.jpg" if "<img" in entry.lower() else "",
+                "thumbnail_widths": [],
+            }
+        )
+    return {"version": 1, "title": title, "description": description, "updated_at": "", "slides": slides}
+
+
+def load_gallery_manifest() -> dict:
+    text, _ = get_repo_text_file(GALLERY_REPO_NAME, GALLERY_MANIFEST_NAME)
+    if text:
+        try:
+            manifest = json.loads(text)
+            if isinstance(manifest, dict) and isinstance(manifest.get("slides"), list):
+                return manifest
+        except ValueError:
+            LOGGER.exception("%s okunamadi; index.html'den yeniden olusturuluyor", GALLERY_MANIFEST_NAME)
+    index_html, _ = get_repo_text_file(GALLERY_REPO_NAME, "index.html")
+    readme, _ = get_repo_text_file(GALLERY_REPO_NAME, "README.md")
+    return legacy_gallery_manifest(index_html or "", readme or "")
+
+
+# Turkish letters fold to their ASCII base, and dotted/dotless i collapse to
+# "i", so a query matches whichever spelling or keyboard was used; search.js
+# applies the same folding to the query.
+_SEARCH_FOLD = str.maketrans({"\u00e7": "c", "\u011f": "g", "\u0131": "i", "\u00f6": "o", "\u015f": "s", "\u00fc": "u"})
+
+
+def search_tokens(text: str) -> List[str]:
+    text = text.replace("\u0130", "i").replace("I", "\u0131").lower().translate(_SEARCH_FOLD)
+    text = "".join(ch for ch in unicodedata.normalize("NFKD", text) if not unicodedata.combining(ch))
+    return sorted({token for token in re.split(r"[^a-z0-9]+", text) if len(token) > 1})
+
+
+def build_search_index(slides: List[dict]) -> dict:
+    """Inverted index over slide titles and descriptions for search.js.
+
+    Tokens are cached per slide under a hash of its text, so a sync only
+    re-tokenizes the slides whose card actually changed.
+    """
+    cache = load_json(SEARCH_CACHE_PATH) if SEARCH_CACHE_PATH.exists() else {}
+    tokens_by_repo: Dict[str, dict] = {}
+    terms: Dict[str, List[int]] = {}
+    for number, slide in enumerate(slides):
+        text = f"{slide['repo']} {slide['title']} {slide['description']}"
+        key = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        cached = cache.get(slide["repo"])
+        tokens = cached["tokens"] if isinstance(cached, dict) and cached.get("key") == key else search_tokens(text)
+        tokens_by_repo[slide["repo"]] = {"key": key, "tokens": tokens}
+        for token in tokens:
+            terms.setdefault(token, []).append(number)
+    if tokens_by_repo != cache:
+        atomic_write_json(SEARCH_CACHE_PATH, tokens_by_repo)
+    return {
+        "version": 1,
+        "base": f"https://{GITHUB_USERNAME}.github.io/",
+        "docs": [[slide["repo"], slide["title"]] for slide in slides],
+        "terms": dict(sorted(terms.items())),
+    }
+
+
+def _atlas_source(slide: dict, refresh: bool) -> Optional[bytes]:
+    """Smallest published thumbnail that still fills an atlas cell, cached between syncs."""
+    cached = ATLAS_CACHE_DIR / f"{slide['repo']}.jpg"
+    if cached.exists() and not refresh:
+        return cached.read_bytes()
+    widths = [width for width in slide.get("thumbnail_widths") or [] if width >= ATLAS_CELL[0]]
+    name = f"thumbnail-{min(widths)}.jpg" if widths else slide["thumbnail"]
+    try:
+        response = public_get(f"https://{GITHUB_USERNAME}.github.io/{slide['repo']}/{name}")
+    except requests.RequestException as exc:
+        LOGGER.info("%s atlas icin indirilemedi: %s", slide["repo"], exc)
+        return None
+    if response.status_code != 200 or not response.content:
+        return None
+    ATLAS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_suffix(".tmp")
+    tmp.write_bytes(response.content)
+    os.replace(tmp, cached)
+    return response.content
+
+
+def viewer_assets() -> Dict[str, bytes]:
+    """The pinned OpenSeadragon files slide viewers load from the gallery repo.
+
+    They are downloaded from cdnjs once and kept under .viewer-assets/. On
+    failure nothing is returned and viewers keep using the cdnjs fallback.
+    """
+    if not VIEWER_SELF_HOST:
+        return {}
+    local = VIEWER_ASSET_DIR / f"openseadragon-{OSD_VERSION}"
+    assets: Dict[str, bytes] = {}
+    for name in ("openseadragon.min.js",) + OSD_BUTTON_IMAGES:
+        path = local / name
+        if not path.exists():
+            try:
+                response = public_get(OSD_CDN_BASE + name)
+            except requests.RequestException as exc:
+                warn(f"OpenSeadragon dosyasi indirilemedi ({name}); goruntuleyici CDN kullanacak: {exc}", stage="gallery")
+                return {}
+            if response.status_code != 200 or not response.content:
+                warn(f"OpenSeadragon dosyasi indirilemedi ({name}): HTTP {response.status_code}", stage="gallery")
+                return {}
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(path.suffix + ".tmp")
+            tmp.write_bytes(response.content)
+            os.replace(tmp, path)
+        assets[f"{OSD_ASSET_PATH}/{name}"] = path.read_bytes()
+    return assets
+
+
+def build_gallery_atlases(slides: List[dict], refresh: Set[str]) -> Tuple[Dict[str, bytes], Dict[str, dict]]:
+    """Pack the card thumbnails of every gallery page into one sprite sheet.
+
+    Returns the atlas files for the gallery repo and, per repo, the CSS
+    background that shows its cell. Slides whose thumbnail cannot be fetched
+    or decoded are left out and keep their own <img>.
+    """
+    try:
+        pyvips = import_pyvips()
+    except UploaderError as exc:
+        warn(f"Galeri atlasi olusturulamadi; kartlar tek tek thumbnail kullanacak: {exc}", stage="gallery")
+        return {}, {}
+    with_thumbnail = [slide for slide in slides if slide.get("thumbnail")]
+    sources = dict(
+        zip(
+            [slide["repo"] for slide in with_thumbnail],
+            map_concurrent(
+                lambda slide: _atlas_source(slide, slide["repo"] in refresh),
+                with_thumbnail,
+                label="Galeri atlasi",
+                stage="gallery",
+            ),
+        )
+    )
+    cell_w, cell_h = ATLAS_CELL
+    files: Dict[str, bytes] = {}
+    placement: Dict[str, dict] = {}
+    for page_start in range(0, len(slides), GALLERY_PAGE_SIZE):
+        cells: List[Any] = []
+        repos: List[str] = []
+        for slide in slides[page_start:page_start + GALLERY_PAGE_SIZE]:
+            data = sources.get(slide["repo"])
+            if not data:
+                continue
+            try:
+                cell = pyvips.Image.thumbnail_buffer(data, cell_w, height=cell_h)
+                if cell.hasalpha():
+                    cell = cell.flatten(background=[255, 255, 255])
+                if cell.bands < 3:
+                    cell = cell.colourspace("srgb")
+                cells.append(cell.embed((cell_w - cell.width) // 2, (cell_h - cell.height) // 2, cell_w, cell_h, extend="white"))
+                repos.append(slide["repo"])
+            except pyvips.Error as exc:
+                LOGGER.info("%s thumbnail'i atlasa eklenemedi: %s", slide["repo"], exc)
+        if not cells:
+            continue
+        columns = min(ATLAS_COLUMNS, len(cells))
+        rows = -(-len(cells) // columns)
+        atlas = pyvips.Image.arrayjoin(cells, across=columns, background=[255, 255, 255])
+        data = atlas.jpegsave_buffer(Q=76, strip=True, optimize_coding=True)
+        path = f"atlas/page-{page_start // GALLERY_PAGE_SIZE + 1}.jpg"
+        files[path] = data
+        url = f"{path}?v={hashlib.sha1(data).hexdigest()[:8]}"
+        for number, repo in enumerate(repos):
+            column, row = number % columns, number // columns
+            placement[repo] = {
+                "url": url,
+                "size": f"{columns * 100}% {rows * 100}%",
+                "position": f"{column * 100 / max(1, columns - 1):.4g}% {row * 100 / max(1, rows - 1):.4g}%",
+            }
+    return files, placement
+
+
+# Precompiled replacement for the Tailwind classes the gallery used to load
+# from the runtime CDN compiler.
+GALLERY_CSS = """*, *::before, *::after { box-sizing: border-box; }
+body { margin: 0; font-family: ui-sans-serif, system-ui, -apple-system, "Segoe UI", Roboto, sans-serif; color: #111827; background: linear-gradient(to bottom, #f3f4f6, #e5e7eb); min-height: 100vh; }
+.container { max-width: 1280px; margin: 0 auto; padding: 3rem 1rem; }
+h1 { font-size: 2.25rem; line-height: 2.5rem; font-weight: 800; text-align: center; color: #111827; margin: 0 0 1rem; }
+#gallery-description { text-align: center; color: #4b5563; max-width: 48rem; margin: 0 auto 3rem; }
+#sortable { list-style: none; margin: 0; padding: 0; display: grid; grid-template-columns: 1fr; gap: 2.5rem; }
+.gallery-item { display: block; background: #fff; padding: 1.5rem; border-radius: 0.75rem; box-shadow: 0 10px 15px -3px rgba(0, 0, 0, 0.1), 0 4px 6px -4px rgba(0, 0, 0, 0.1); transition: transform 0.3s ease, box-shadow 0.3s ease; content-visibility: auto; contain-intrinsic-size: auto 22rem; }
+.gallery-item[hidden] { display: none; }
+.gallery-item:hover { transform: scale(1.03); box-shadow: 0 12px 20px -4px rgba(0, 0, 0, 0.15); }
+.gallery-item a { display: block; color: inherit; text-decoration: none; }
+.gallery-item img { display: block; width: 100%; height: 16rem; object-fit: contain; border-radius: 0.5rem; margin-bottom: 1rem; transition: transform 0.3s ease; }
+.gallery-item:hover img { transform: scale(1.08); }
+.gallery-item .thumb { display: block; width: 100%; max-width: 21.333rem; aspect-ratio: 4 / 3; margin: 0 auto 1rem; border-radius: 0.5rem; background-color: #fff; background-repeat: no-repeat; transition: transform 0.3s ease; }
+.gallery-item:hover .thumb { transform: scale(1.08); }
+.gallery-item h2 { font-size: 1.25rem; line-height: 1.75rem; font-weight: 600; color: #2563eb; margin: 0; }
+.gallery-item a:hover h2 { text-decoration: underline; }
+.gallery-item p { color: #4b5563; font-size: 0.875rem; line-height: 1.25rem; margin: 0.5rem 0 0; }
+#more { display: block; margin: 2.5rem auto 0; padding: 0.75rem 1.5rem; border: 0; border-radius: 0.5rem; background: #2563eb; color: #fff; font-size: 1rem; cursor: pointer; }
+#more[hidden] { display: none; }
+footer { margin-top: 3rem; text-align: center; color: #6b7280; font-size: 0.875rem; }
+@media (min-width: 640px) { .container { padding: 3rem 1.5rem; } h1 { font-size: 3rem; line-height: 1; } #sortable { grid-template-columns: repeat(2, minmax(0, 1fr)); } }
+@media (min-width: 1024px) { .container { padding: 3rem 2rem; } #sortable { grid-template-columns: repeat(3, minmax(0, 1fr)); } }
+"""
+
+GALLERY_SCRIPT = """(function () {
+    var button = document.getElementById("more");
+    function rest() { return document.querySelectorAll("#sortable > li[hidden]"); }
+    function update() {
+        var count = rest().length;
+        button.hidden = count === 0;
+        button.textContent = "Show more (" + count + ")";
+    }
+    button.addEventListener("click", function () {
+        var items = rest();
+        for (var i = 0; i < items.length && i < %d; i++) { items[i].hidden = false; }
+        update();
+    });
+    update();
+})();"""
+
+# Shared by index.html and the hand-made pages: on the gallery page matching
+# cards are filtered in place, elsewhere matches are listed under the box.
+GALLERY_SEARCH_SCRIPT = r"""(function () {
+    "use strict";
+    var box = document.getElementById("gallery-search");
+    if (!box || !window.fetch) { return; }
+    var style = document.createElement("style");
+    style.textContent = "#gallery-search { max-width: 32rem; margin: 0 auto 2.5rem; }"
+        + " #gallery-search input { width: 100%; padding: 0.625rem 0.875rem; font-size: 1rem; border: 1px solid #d1d5db; border-radius: 0.5rem; background: #fff; }"
+        + " #gallery-search ul { list-style: none; margin: 0.5rem 0 0; padding: 0; }"
+        + " #gallery-search li a { display: block; padding: 0.375rem 0.25rem; color: #2563eb; }";
+    document.head.appendChild(style);
+    var input = document.createElement("input");
+    input.type = "search";
+    input.placeholder = box.getAttribute("data-placeholder") || "Search slides";
+    input.setAttribute("aria-label", input.placeholder);
+    var results = document.createElement("ul");
+    box.appendChild(input);
+    box.appendChild(results);
+    var cards = document.querySelectorAll("#sortable > li[data-repo]");
+    var more = document.getElementById("more");
+    var index = null;
+    var loading = null;
+    var paged = null;
+
+    function tokens(text) {
+        text = text.replace(/\u0130/g, "i").replace(/I/g, "\u0131").toLowerCase().replace(/\u0131/g, "i");
+        text = text.normalize ? text.normalize("NFKD").replace(/[\u0300-\u036f]/g, "") : text;
+        return text.split(/[^a-z0-9]+/).filter(function (token) { return token.length > 1; });
+    }
+    function search(query) {
+        var words = tokens(query);
+        if (!words.length) { return null; }
+        var terms = Object.keys(index.terms);
+        var found = null;
+        words.forEach(function (word) {
+            var hits = {};
+            terms.forEach(function (term) {
+                if (term.lastIndexOf(word, 0) === 0) {
+                    index.terms[term].forEach(function (doc) { hits[doc] = true; });
+                }
+            });
+            if (found !== null) {
+                Object.keys(found).forEach(function (doc) { if (!hits[doc]) { delete found[doc]; } });
+            } else {
+                found = hits;
+            }
+        });
+        return Object.keys(found).map(Number).sort(function (a, b) { return a - b; });
+    }
+    function showCards(docs) {
+        var i;
+        if (docs === null) {
+            if (paged) {
+                for (i = 0; i < cards.length; i++) { cards[i].hidden = paged[i]; }
+                paged = null;
+            }
+            if (more) { more.hidden = !document.querySelector("#sortable > li[hidden]"); }
+            return;
+        }
+        if (!paged) {
+            paged = [];
+            for (i = 0; i < cards.length; i++) { paged.push(cards[i].hidden); }
+        }
+        var wanted = {};
+        docs.forEach(function (doc) { wanted[index.docs[doc][0]] = true; });
+        for (i = 0; i < cards.length; i++) { cards[i].hidden = !wanted[cards[i].getAttribute("data-repo")]; }
+        if (more) { more.hidden = true; }
+    }
+    function showList(docs) {
+        results.textContent = "";
+        (docs || []).slice(0, 20).forEach(function (doc) {
+            var item = document.createElement("li");
+            var link = document.createElement("a");
+            link.href = index.base + index.docs[doc][0] + "/";
+            link.textContent = index.docs[doc][1];
+            item.appendChild(link);
+            results.appendChild(item);
+        });
+    }
+    input.addEventListener("input", function () {
+        var query = input.value;
+        loading = loading || fetch(box.getAttribute("data-index") || "search-index.json")
+            .then(function (response) { return response.json(); })
+            .then(function (data) { index = data; });
+        loading.then(function () {
+            if (input.value !== query) { return; }
+            var docs = search(query);
+            if (cards.length) { showCards(docs); } else { showList(docs); }
+        }, function () { loading = null; });
+    });
+})();
+"""
 
 
-def gallery_shell(entries: List[str], gallery_title: str, gallery_description: str) -> str:
+def gallery_shell(
+    slides: List[dict],
+    gallery_title: str,
+    gallery_description: str,
+    updated_at: Optional[str] = None,
+    atlas: Optional[Dict[str, dict]] = None,
+) -> str:
+    # Every card stays in the page (links must be crawlable and are used by
+    # the live check); cards after the first page start hidden and images
+    # load lazily, so only the visible thumbnails are downloaded. With an
+    # atlas a whole page of thumbnails is a single image, and hidden cards
+    # do not fetch their page's atlas until they are shown.
+    atlas = atlas or {}
+    entries = [
+        render_gallery_entry(slide, hidden=index >= GALLERY_PAGE_SIZE, atlas=atlas.get(slide["repo"]))
+        for index, slide in enumerate(slides)
+    ]
+    first = next((atlas[slide["repo"]]["url"] for slide in slides[:GALLERY_PAGE_SIZE] if slide["repo"] in atlas), None)
+    preload = f'\n    <link rel="preload" as="image" href="{html.escape(first, quote=True)}">' if first else ""
     joined = "\n        ".join(entries)
     title_escaped = html.escape(gallery_title)
     desc_escaped = html.escape(gallery_description)
+    css_version = hashlib.sha1(GALLERY_CSS.encode("utf-8")).hexdigest()[:8]
+    search_version = hashlib.sha1(GALLERY_SEARCH_SCRIPT.encode("utf-8")).hexdigest()[:8]
     return f"""<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -1180,97 +3708,31 @@ def gallery_shell(entries: List[str], gallery_title: str, gallery_description: s
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <meta name="description" content="{html.escape(gallery_description, quote=True)}">
     <title>{title_escaped}</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <style>
-        .gallery-item {{ transition: transform 0.3s ease, box-shadow 0.3s ease; }}
-        .gallery-item:hover {{ transform: scale(1.03); box-shadow: 0 12px 20px -4px rgba(0, 0, 0, 0.15); }}
-        .gallery-item img {{ transition: transform 0.3s ease; }}
-        .gallery-item:hover img {{ transform: scale(1.08); }}
-        body {{ background: linear-gradient(to bottom, #f3f4f6, #e5e7eb); }}
-    </style>
+    <link rel="stylesheet" href="gallery.css?v={css_version}">{preload}
+    <noscript><style>#sortable > li.gallery-item[hidden] {{ display: block; }}</style></noscript>
 </head>
 <body>
-    <div class="container mx-auto px-4 sm:px-6 lg:px-8 py-12">
-        <h1 class="text-4xl sm:text-5xl font-extrabold text-center text-gray-900 mb-4">{title_escaped}</h1>
-        <p id="gallery-description" class="text-center text-gray-600 max-w-3xl mx-auto mb-12">{desc_escaped}</p>
-        <ul id="sortable" class="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 gap-10">
+    <div class="container">
+        <h1>{title_escaped}</h1>
+        <p id="gallery-description">{desc_escaped}</p>
+        <div id="gallery-search"></div>
+        <ul id="sortable">
         {joined}
         </ul>
-        <footer class="mt-12 text-center text-gray-500 text-sm">
-            Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}
+        <button id="more" type="button" hidden>Show more</button>
+        <footer>
+            Last updated: {updated_at or time.strftime('%Y-%m-%d %H:%M:%S')}
         </footer>
     </div>
+    <script>
+{GALLERY_SCRIPT % GALLERY_PAGE_SIZE}
+    </script>
+    <script src="{SEARCH_SCRIPT_NAME}?v={search_version}" defer></script>
 </body>
 </html>
 """
 
 
-def replace_gallery_list(existing_html: str, entries: List[str]) -> str:
-    if not existing_html:
-        return ""
-    pattern = re.compile(
-        r'(<ul\b[^>]*id=["\']sortable["\'][^>]*>)(.*?)(</ul>)',
-        flags=re.DOTALL | re.IGNORECASE,
-    )
-    match = pattern.search(existing_html)
-    if not match:
-        return ""
-    joined = "\n        " + "\n        ".join(entries) + "\n        "
-    updated = existing_html[: match.start(2)] + joined + existing_html[match.end(2) :]
-    updated = re.sub(
-        r"Last updated:\s*[^<\r\n]+",
-        f"Last updated: {time.strftime('%Y-%m-%d %H:%M:%S')}",
-        updated,
-        count=1,
-        flags=re.IGNORECASE,
-    )
-    return updated
-
-
-def apply_gallery_header(existing_html: str, title: str, description: str) -> str:
-    title_e = html.escape(title)
-    desc_e = html.escape(description)
-    desc_attr = html.escape(description, quote=True)
-    result = existing_html
-    if re.search(r"<title>.*?</title>", result, flags=re.DOTALL | re.IGNORECASE):
-        result = re.sub(r"<title>.*?</title>", f"<title>{title_e}</title>", result, count=1, flags=re.DOTALL | re.IGNORECASE)
-    else:
-        result = result.replace("</head>", f"    <title>{title_e}</title>\n</head>", 1)
-
-    meta_pattern = r'<meta\s+name=["\']description["\'][^>]*>'
-    meta_tag = f'<meta name="description" content="{desc_attr}">'
-    if re.search(meta_pattern, result, flags=re.IGNORECASE):
-        result = re.sub(meta_pattern, meta_tag, result, count=1, flags=re.IGNORECASE)
-    else:
-        result = result.replace("</head>", f"    {meta_tag}\n</head>", 1)
-
-    h1_pattern = r"(<h1\b[^>]*>)(.*?)(</h1>)"
-    if re.search(h1_pattern, result, flags=re.DOTALL | re.IGNORECASE):
-        result = re.sub(
-            h1_pattern,
-            lambda m: m.group(1) + title_e + m.group(3),
-            result,
-            count=1,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-
-    desc_pattern = r'(<p\b[^>]*id=["\']gallery-description["\'][^>]*>)(.*?)(</p>)'
-    if re.search(desc_pattern, result, flags=re.DOTALL | re.IGNORECASE):
-        result = re.sub(
-            desc_pattern,
-            lambda m: m.group(1) + desc_e + m.group(3),
-            result,
-            count=1,
-            flags=re.DOTALL | re.IGNORECASE,
-        )
-    else:
-        h1_match = re.search(r"</h1>", result, flags=re.IGNORECASE)
-        if h1_match:
-            insertion = f'\n        <p id="gallery-description" class="text-center text-gray-600 max-w-3xl mx-auto mb-12">{desc_e}</p>'
-            result = result[: h1_match.end()] + insertion + result[h1_match.end() :]
-    return result
-
-
 def parse_gallery_settings(index_html: str, readme: str) -> Tuple[str, str]:
     title = "Slide Gallery"
     description = "Interactive whole-slide microscopy gallery."
@@ -1309,9 +3771,13 @@ def parse_gallery_settings(index_html: str, readme: str) -> Tuple[str, str]:
 
 
 def load_remote_gallery_settings() -> Tuple[str, str]:
-    index_html, _ = get_repo_text_file(GALLERY_REPO_NAME, "index.html")
-    readme, _ = get_repo_text_file(GALLERY_REPO_NAME, "README.md")
-    return parse_gallery_settings(index_html or "", readme or "")
+    try:
+        manifest = load_gallery_manifest()
+    except UploaderError:
+        if not GALLERY_MANIFEST_MIRROR.exists():
+            raise
+        manifest = load_json(GALLERY_MANIFEST_MIRROR)
+    return manifest.get("title") or "Slide Gallery", manifest.get("description") or ""
 
 
 def ensure_gallery_repo_exists() -> dict:
@@ -1332,55 +3798,65 @@ def sync_gallery(
     info = ensure_gallery_repo_exists()
     say("Ana galeri senkronize ediliyor...", stage="gallery", progress=90)
     remote_names = gallery_repo_names()
-    existing_html, _ = get_repo_text_file(GALLERY_REPO_NAME, "index.html")
-    existing_html = existing_html or ""
-    existing_readme, _ = get_repo_text_file(GALLERY_REPO_NAME, "README.md")
-    existing_readme = existing_readme or ""
-    current_title, current_desc = parse_gallery_settings(existing_html, existing_readme)
-    title = (gallery_title or current_title).strip() or "Slide Gallery"
-    desc = (gallery_description if gallery_description is not None else current_desc).strip()
-
-    existing_entries = re.findall(r"<li\b[^>]*>.*?</li>", existing_html, flags=re.DOTALL | re.IGNORECASE)
-    entry_map: Dict[str, str] = {}
-    order: List[str] = []
-    for entry in existing_entries:
-        repo = repo_name_from_entry(entry)
-        if repo and repo in remote_names and repo not in entry_map:
-            entry_map[repo] = entry.strip()
-            order.append(repo)
-
-    for repo in remote_names:
-        if repo not in entry_map:
-            if discover_missing or repo in refresh_repos:
-                entry_map[repo] = make_gallery_entry(repo)
-                order.append(repo)
-        elif repo in refresh_repos:
-            entry_map[repo] = make_gallery_entry(repo)
-
-    order = [repo for repo in order if repo in remote_names]
-    entries = [entry_map[repo] for repo in order]
-    updated_html = replace_gallery_list(existing_html, entries)
-    if not updated_html:
-        updated_html = gallery_shell(entries, title, desc)
-    else:
-        updated_html = apply_gallery_header(updated_html, title, desc)
-
-    put_repo_text_file(GALLERY_REPO_NAME, "index.html", updated_html, "Update slide gallery")
-
-    md_lines = [line for line in (entry_to_markdown(entry) for entry in entries) if line]
-    readme = (
-        f"# {title}\n\n"
-        + (desc + "\n\n" if desc else "")
-        + f"Live gallery: https://{GITHUB_USERNAME}.github.io/{GALLERY_REPO_NAME}/\n\n"
-        + "## Slides Overview\n\n"
-        + ("\n\n".join(md_lines) if md_lines else "No slides found.")
-        + "\n\n---\n"
-        + f"Updated automatically on {time.strftime('%Y-%m-%d %H:%M:%S')}.\n"
+    manifest = load_gallery_manifest()
+    title = (gallery_title or manifest.get("title") or "").strip() or "Slide Gallery"
+    desc = (gallery_description if gallery_description is not None else manifest.get("description") or "").strip()
+
+    slides: Dict[str, dict] = {}
+    for slide in manifest["slides"]:
+        if slide.get("repo") in remote_names and slide["repo"] not in slides:
+            slides[slide["repo"]] = slide
+    order = list(slides)
+    wanted = [
+        repo
+        for repo in remote_names
+        if repo in refresh_repos or (repo not in slides and discover_missing)
+    ]
+    metadata = fetch_slide_metadata_batch(wanted) if wanted else {}
+    fresh = map_concurrent(
+        lambda repo: gallery_slide(repo, metadata.get(repo)),
+        wanted,
+        label="Galeri kartlari",
+        stage="gallery",
     )
-    put_repo_text_file(GALLERY_REPO_NAME, "README.md", readme, "Update gallery README")
+    for repo, slide in zip(wanted, fresh):
+        if repo not in slides:
+            order.append(repo)
+        slides[repo] = slide
+
+    updated = {
+        "version": 1,
+        "title": title,
+        "description": desc,
+        "updated_at": manifest.get("updated_at") or "",
+        "slides": [slides[repo] for repo in order],
+    }
+    # The timestamp only moves when the content does, so a sync without
+    # changes leaves every file identical and makes no commit.
+    if not updated["updated_at"] or {**updated, "updated_at": ""} != {**manifest, "updated_at": ""}:
+        updated["updated_at"] = time.strftime("%Y-%m-%d %H:%M:%S")
+    atlas_files, atlas = build_gallery_atlases(updated["slides"], set(wanted)) if GALLERY_ATLAS else ({}, {})
+    page = gallery_shell(updated["slides"], title, desc, updated["updated_at"], atlas)
     branch = info.get("default_branch") or "main"
+    commit_repo_files(
+        GALLERY_REPO_NAME,
+        branch,
+        {
+            GALLERY_MANIFEST_NAME: json.dumps(updated, ensure_ascii=False, indent=2) + "\n",
+            "index.html": page,
+            "gallery.css": GALLERY_CSS,
+            SEARCH_INDEX_NAME: json.dumps(build_search_index(updated["slides"]), ensure_ascii=False, separators=(",", ":")) + "\n",
+            SEARCH_SCRIPT_NAME: GALLERY_SEARCH_SCRIPT,
+            "README.md": render_gallery_readme(updated),
+            **atlas_files,
+            **viewer_assets(),
+        },
+        "Update slide gallery",
+        prune="atlas",
+    )
+    atomic_write_json(GALLERY_MANIFEST_MIRROR, updated)
     ensure_pages(GALLERY_REPO_NAME, branch)
-    say(f"Galeri GitHub'a yazildi ({len(entries)} slayt).", stage="gallery", progress=94)
+    say(f"Galeri GitHub'a yazildi ({len(updated['slides'])} slayt).", stage="gallery", progress=94)
 
 
 def wait_for_gallery_live(
@@ -1420,22 +3896,6 @@ def wait_for_gallery_live(
 # Archive / local cleanup / recovery safety
 # -----------------------------------------------------------------------------
 
-def release_vips_file_handles() -> None:
-    """Best-effort release of libvips cached file handles before moving SVS files on Windows."""
-    try:
-        pyvips = import_pyvips()
-        for name, value in (("cache_set_max", 0), ("cache_set_max_mem", 0), ("cache_set_max_files", 0)):
-            func = getattr(pyvips, name, None)
-            if callable(func):
-                try:
-                    func(value)
-                except Exception:
-                    pass
-    except Exception:
-        pass
-    gc.collect()
-
-
 def _move_if_in_inbox(path: Optional[Path]) -> Optional[Path]:
     if not path or not path.exists():
         return None
@@ -1445,13 +3905,12 @@ def _move_if_in_inbox(path: Optional[Path]) -> Optional[Path]:
         return None
     destination = unique_destination(DONE_DIR, path.name)
 
-    # On Windows libvips/antivirus can keep an SVS handle open briefly after
-    # DeepZoom/thumbnail generation. Never classify that as an upload failure
-    # immediately: release caches and retry the rename first.
+    # libvips only opens the SVS in spawned worker processes, but on Windows an
+    # antivirus scan can still hold the file briefly. Never classify that as an
+    # upload failure immediately: retry the rename first.
     last_error: Optional[BaseException] = None
     for attempt in range(1, 9):
         try:
-            release_vips_file_handles()
             shutil.move(str(path), str(destination))
             return destination
         except (PermissionError, OSError) as exc:
@@ -1501,7 +3960,92 @@ def cleanup_job_local_repo(job: SlideJob, *, automatic: bool = False) -> bool:
     return True
 
 
-def verify_existing_local_repo_safe(repo_path: Path) -> Tuple[bool, str, int]:
+def manifest_tree_sha(files: Dict[str, List[Any]]) -> str:
+    """Git tree id of a tile level directory, computed from the manifest's blob ids alone."""
+    body = b"".join(
+        b"100644 " + name.encode("utf-8") + b"\0" + bytes.fromhex(files[name][0])
+        for name in sorted(files, key=lambda item: item.encode("utf-8"))
+    )
+    return hashlib.sha1(b"tree %d\0" % len(body) + body).hexdigest()
+
+
+def remote_tree_entries(repo_name: str, tree_sha: str, *, recursive: bool = False) -> Tuple[Dict[str, Tuple[str, int]], bool]:
+    """path -> (sha, size) of a remote git tree, and whether GitHub truncated the listing."""
+    data = api_request(
+        "GET",
+        f"/repos/{GITHUB_USERNAME}/{repo_name}/git/trees/{tree_sha}" + ("?recursive=1" if recursive else ""),
+    ).json()
+    entries = {item["path"]: (item["sha"], int(item.get("size") or 0)) for item in data.get("tree", [])}
+    return entries, bool(data.get("truncated"))
+
+
+def _compare_tiles(prefix: str, files: Dict[str, List[Any]], remote: Dict[str, Tuple[str, int]]) -> List[str]:
+    mismatches = []
+    for name, (sha, size) in files.items():
+        found = remote.get(prefix + name)
+        if found is None:
+            mismatches.append(f"{prefix}{name} eksik")
+        elif found[0] != sha or found[1] != size:
+            mismatches.append(f"{prefix}{name} farkli")
+    return mismatches
+
+
+def verify_remote_tree(repo_path: Path, repo_name: str, remote_sha: str) -> Tuple[bool, str]:
+    """Prove from the remote git tree that every tile in the local manifest is on GitHub.
+
+    The tree is the one GitHub's branch commit remote_sha points to, read
+    from GitHub's commit object. One recursive tree listing covers most slides. When GitHub truncates it
+    (about 100k entries), each level's tree id is compared with the one the
+    manifest implies, and only levels that differ are listed tile by tile.
+    Nothing is downloaded except tree listings.
+    """
+    index = read_manifest_index(repo_path) if (repo_path / MANIFEST_DIR_NAME).is_dir() else {}
+    if not index.get("complete"):
+        return True, "karo manifesti yok; GitHub agaci karsilastirilmadi"
+    levels = {
+        level: load_json(repo_path / MANIFEST_DIR_NAME / f"level-{level}.json").get("files") or {}
+        for level in sorted(index.get("levels") or {}, key=int)
+    }
+    commit = api_request("GET", f"/repos/{GITHUB_USERNAME}/{repo_name}/git/commits/{remote_sha}").json()
+    tree_sha = (commit.get("tree") or {}).get("sha")
+    if not tree_sha:
+        return False, "GitHub commit agaci okunamadi"
+    entries, truncated = remote_tree_entries(repo_name, tree_sha, recursive=True)
+    mismatches: List[str] = []
+    if not truncated:
+        for level, files in levels.items():
+            mismatches += _compare_tiles(f"slide_files/{level}/", files, entries)
+    else:
+        root, _ = remote_tree_entries(repo_name, tree_sha)
+        if "slide_files" not in root:
+            return False, "GitHub agacinda slide_files yok"
+        level_trees, _ = remote_tree_entries(repo_name, root["slide_files"][0])
+        for level, files in levels.items():
+            remote = level_trees.get(level)
+            if remote is None:
+                mismatches.append(f"slide_files/{level}/ eksik")
+                continue
+            if remote[0] == manifest_tree_sha(files):
+                continue
+            listing, cut = remote_tree_entries(repo_name, remote[0])
+            if cut:
+                mismatches.append(f"slide_files/{level}/ agaci farkli")
+            else:
+                prefix = f"slide_files/{level}/"
+                mismatches += _compare_tiles(prefix, files, {prefix + name: entry for name, entry in listing.items()})
+    if mismatches:
+        LOGGER.warning("%s GitHub agaci manifestle eslesmiyor: %s", repo_name, ", ".join(mismatches[:20]))
+        return False, f"{len(mismatches)} karo GitHub agaciyla eslesmiyor (ornek: {mismatches[0]})"
+    return True, f"{sum(len(files) for files in levels.values())} karo GitHub agaciyla eslesti"
+
+
+def verify_existing_local_repo_safe(repo_path: Path, *, full_sample: bool = False) -> Tuple[bool, str, int]:
+    """Check that a local slide repo is fully on GitHub and live on Pages.
+
+    A tile sample that already passed for the current HEAD is reused. Otherwise
+    scans probe CLEANUP_SCAN_TILE_SAMPLE tiles per level and full_sample (used
+    right before deleting) runs the full PAGES_TILE_SAMPLE and records a pass.
+    """
     repo_name = repo_path.name
     if not re.match(rf"^{re.escape(REPO_PREFIX)}\d+$", repo_name):
         return False, "slide repo degil", 0
@@ -1523,12 +4067,31 @@ def verify_existing_local_repo_safe(repo_path: Path) -> Tuple[bool, str, int]:
     remote_sha = remote_branch_sha(repo_name, branch)
     if not remote_sha or local_sha != remote_sha:
         return False, "yerel ve GitHub commit farkli", folder_size(repo_path)
+    # A commit's tree never changes, so one passed comparison per SHA is enough.
+    if CLEANUP_TREE_VERIFY and load_json(repo_path / MARKER_NAME).get("tree_verified_sha") != remote_sha:
+        tree_ok, tree_detail = verify_remote_tree(repo_path, repo_name, remote_sha)
+        if not tree_ok:
+            return False, tree_detail, folder_size(repo_path)
+        _record_marker_sha(repo_path, "tree_verified_sha", remote_sha)
     url = f"https://{GITHUB_USERNAME}.github.io/{repo_name}/"
     try:
-        page = public_get(url + f"?v={int(time.time())}", timeout=10)
-        dzi = public_get(url + f"slide.dzi?v={int(time.time())}", timeout=10)
-        if page.status_code != 200 or dzi.status_code != 200 or "<Image" not in dzi.text[:1200]:
-            return False, f"web dogrulanmadi ({page.status_code}/{dzi.status_code})", folder_size(repo_path)
+        page = public_exists(url + f"?v={int(time.time())}", timeout=10)
+        dzi_status, dzi_text = public_head_text(url + f"slide.dzi?v={int(time.time())}", timeout=10)
+        if not page or dzi_status != 200 or "<Image" not in dzi_text:
+            return False, f"web dogrulanmadi ({'200' if page else 'yok'}/{dzi_status})", folder_size(repo_path)
+        if recorded_tile_sample(repo_path) != local_sha:
+            # Cleanup scans already check several repos at once.
+            checked, missing = verify_tile_sample(
+                repo_path,
+                url,
+                repo_name,
+                workers=max(1, PAGES_TILE_WORKERS // FANOUT_WORKERS),
+                sample=PAGES_TILE_SAMPLE if full_sample else CLEANUP_SCAN_TILE_SAMPLE,
+            )
+            if missing:
+                return False, f"{len(missing)}/{checked} ornek karo yayinda yok", folder_size(repo_path)
+            if full_sample:
+                record_tile_sample(repo_path, local_sha)
     except Exception as exc:
         return False, f"web kontrol hatasi: {exc}", folder_size(repo_path)
     return True, "GitHub commit ve web dogrulandi", folder_size(repo_path)
@@ -1536,23 +4099,142 @@ def verify_existing_local_repo_safe(repo_path: Path) -> Tuple[bool, str, int]:
 
 def scan_cleanup_candidates(skip_repos: Optional[Set[str]] = None) -> List[Tuple[str, Path, int]]:
     skip_repos = skip_repos or set()
-    candidates: List[Tuple[str, Path, int]] = []
-    for path in sorted(LOCAL_REPO_BASE.glob(f"{REPO_PREFIX}*")):
-        if not path.is_dir() or path.name in skip_repos:
-            continue
+    paths = [
+        path
+        for path in sorted(LOCAL_REPO_BASE.glob(f"{REPO_PREFIX}*"))
+        if path.is_dir() and path.name not in skip_repos
+    ]
+
+    def check(path: Path) -> Tuple[bool, str, int]:
         try:
-            safe, _, size = verify_existing_local_repo_safe(path)
-            if safe:
-                candidates.append((path.name, path, size))
+            return verify_existing_local_repo_safe(path)
         except Exception:
             LOGGER.exception("Eski repo temizleme kontrolu basarisiz: %s", path)
-    return candidates
+            return False, "kontrol hatasi", 0
+
+    results = map_concurrent(check, paths, label="Temizlik taramasi", stage="cleanup")
+    return [(path.name, path, size) for path, (safe, _, size) in zip(paths, results) if safe]
 
 
 # -----------------------------------------------------------------------------
 # Batch workflow
 # -----------------------------------------------------------------------------
 
+@dataclass
+class PipelineStage:
+    name: str
+    run: Callable[[SlideJob], bool]
+    workers: int = 1
+    queued_stage: Optional[str] = None
+
+
+_PIPELINE_STOP = object()
+
+
+class SlidePipeline:
+    """Runs jobs through ordered stages, each with its own worker pool and bounded queue.
+
+    A stage returns False when the job needs no further stages (for example an
+    already verified slide). Job state is still persisted by the stage functions
+    through SlideJob.save_state, so an interrupted pipeline resumes per job.
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[PipelineStage],
+        *,
+        queue_size: int = 2,
+        cancel: Optional[threading.Event] = None,
+    ) -> None:
+        self.stages = list(stages)
+        self.cancel = cancel
+        # The first queue is only fed by the batch itself; later queues are
+        # bounded so a fast converter cannot run far ahead of a slow uplink.
+        self.queues: List["queue.Queue[Any]"] = [queue.Queue()] + [
+            queue.Queue(maxsize=max(1, queue_size)) for _ in self.stages[1:]
+        ]
+        self.lock = threading.Lock()
+        self.remaining = [max(1, stage.workers) for stage in self.stages]
+        self.successful: List[Tuple[int, SlideJob]] = []
+        self.failed: List[Tuple[int, SlideJob, str]] = []
+        self.total = 0
+
+    def run(self, jobs: List[SlideJob]) -> Tuple[List[SlideJob], List[Tuple[SlideJob, str]]]:
+        self.total = len(jobs)
+        threads: List[threading.Thread] = []
+        for stage_index, stage in enumerate(self.stages):
+            for worker_index in range(max(1, stage.workers)):
+                thread = threading.Thread(
+                    target=self._worker,
+                    args=(stage_index,),
+                    name=f"pipeline-{stage.name}-{worker_index + 1}",
+                    daemon=True,
+                )
+                thread.start()
+                threads.append(thread)
+        first = self.queues[0]
+        for index, job in enumerate(jobs, start=1):
+            first.put((index, job))
+        for _ in range(max(1, self.stages[0].workers)):
+            first.put(_PIPELINE_STOP)
+        for thread in threads:
+            thread.join()
+        successful = [job for _, job in sorted(self.successful, key=lambda item: item[0])]
+        failed = [(job, error) for _, job, error in sorted(self.failed, key=lambda item: item[0])]
+        return successful, failed
+
+    def _worker(self, stage_index: int) -> None:
+        stage = self.stages[stage_index]
+        inbox = self.queues[stage_index]
+        is_last = stage_index == len(self.stages) - 1
+        try:
+            while True:
+                item = inbox.get()
+                if item is _PIPELINE_STOP:
+                    break
+                index, job = item
+                if stage_index == 0:
+                    emit(
+                        "batch",
+                        f"{index}/{self.total}: {job.slide_title}",
+                        repo=job.repo_name,
+                        batch_index=index,
+                        batch_total=self.total,
+                    )
+                if self.cancel is not None and self.cancel.is_set():
+                    # Stopped by the user: leave the saved state untouched so
+                    # the next run resumes this slide where it left off.
+                    message = "Yukleme durduruldu; sonraki calistirmada kaldigi yerden devam edecek."
+                    emit("warning", message, repo=job.repo_name, stage="stopped")
+                    with self.lock:
+                        self.failed.append((index, job, message))
+                    continue
+                try:
+                    proceed = stage.run(job)
+                except Exception as exc:
+                    job.save_state(last_error=str(exc), stage="error")
+                    LOGGER.exception("Slide upload failed (%s): %s", stage.name, job.svs_path.name)
+                    emit("error", str(exc), repo=job.repo_name, stage="error")
+                    with self.lock:
+                        self.failed.append((index, job, str(exc)))
+                    continue
+                if not proceed or is_last:
+                    with self.lock:
+                        self.successful.append((index, job))
+                    continue
+                following = self.stages[stage_index + 1]
+                if following.queued_stage:
+                    say("Siradaki asama bekleniyor...", repo=job.repo_name, stage=following.queued_stage)
+                self.queues[stage_index + 1].put((index, job))
+        finally:
+            with self.lock:
+                self.remaining[stage_index] -= 1
+                last_worker = self.remaining[stage_index] == 0
+            if last_worker and not is_last:
+                for _ in range(max(1, self.stages[stage_index + 1].workers)):
+                    self.queues[stage_index + 1].put(_PIPELINE_STOP)
+
+
 def process_batch(
     jobs: List[SlideJob],
     *,
@@ -1560,18 +4242,16 @@ def process_batch(
     gallery_description: str,
     auto_cleanup: bool,
 ) -> Tuple[List[SlideJob], List[Tuple[SlideJob, str]]]:
-    successful_uploads: List[SlideJob] = []
-    failed: List[Tuple[SlideJob, str]] = []
-
-    for index, job in enumerate(jobs, start=1):
-        emit("batch", f"{index}/{len(jobs)}: {job.slide_title}", repo=job.repo_name, batch_index=index, batch_total=len(jobs))
-        try:
-            successful_uploads.append(process_slide_upload(job))
-        except Exception as exc:
-            job.save_state(last_error=str(exc), stage="error")
-            LOGGER.exception("Slide upload failed: %s", job.svs_path.name)
-            emit("error", str(exc), repo=job.repo_name, stage="error")
-            failed.append((job, str(exc)))
+    pipeline = SlidePipeline(
+        [
+            PipelineStage("convert", convert_slide_stage, PIPELINE_CONVERT_WORKERS),
+            PipelineStage("publish", publish_slide_stage, PIPELINE_PUSH_WORKERS, queued_stage="push_queue"),
+            PipelineStage("verify", verify_slide_stage, PIPELINE_VERIFY_WORKERS, queued_stage="pages_queue"),
+        ],
+        queue_size=PIPELINE_QUEUE_SIZE,
+        cancel=DEEPZOOM_CANCEL,
+    )
+    successful_uploads, failed = pipeline.run(jobs)
 
     if successful_uploads:
         try:
@@ -1636,6 +4316,7 @@ def process_batch(
                 progress=100,
             )
 
+    emit("throughput", public_timing_summary())
     emit(
         "batch_done",
         f"Tamamlandi: {len(completed)} tam, {len(failed)} yeniden deneme bekliyor",
@@ -1667,6 +4348,41 @@ def run_check() -> None:
     say("KONTROL BASARILI")
 
 
+def benchmark_git_profile(tile_count: int, tile_bytes: int = 16 * 1024) -> None:
+    """Time commit and push of a synthetic slide_files tree with and without the payload profile."""
+    check_git()
+    root = Path(tempfile.mkdtemp(prefix=".git-benchmark-", dir=str(LOCAL_REPO_BASE)))
+    try:
+        results: List[Tuple[str, float, float]] = []
+        for name, tuned in (("varsayilan", False), ("sikistirilmis-veri", True)):
+            repo = root / name
+            remote = root / f"{name}.git"
+            repo.mkdir()
+            run_command(["git", "init", "-q", "--bare", str(remote)], cwd=root)
+            git(["init", "-q"], repo)
+            git(["config", "user.name", "benchmark"], repo)
+            git(["config", "user.email", "benchmark@example.invalid"], repo)
+            if tuned:
+                apply_git_payload_profile(repo)
+            for index in range(tile_count):
+                # Random bytes compress about as badly as real JPEG tiles.
+                level = repo / "slide_files" / str(index // 1000)
+                level.mkdir(parents=True, exist_ok=True)
+                (level / f"{index % 1000}_0.jpeg").write_bytes(os.urandom(tile_bytes))
+            started = time.monotonic()
+            git(["add", "-A"], repo)
+            git(["commit", "-q", "-m", "benchmark"], repo)
+            committed = time.monotonic()
+            git(["push", "-q", str(remote), "HEAD:refs/heads/main"], repo)
+            pushed = time.monotonic()
+            results.append((name, committed - started, pushed - committed))
+        say(f"Git profil olcumu: {tile_count} karo x {human_bytes(tile_bytes)}")
+        for name, commit_seconds, push_seconds in results:
+            say(f"  {name:<20} commit {commit_seconds:6.1f} sn   push {push_seconds:6.1f} sn")
+    finally:
+        safe_rmtree(root)
+
+
 def cli_upload() -> int:
     require_config()
     check_git()
@@ -1707,10 +4423,13 @@ def launch_gui() -> int:
         "deepzoom_ready": "DeepZoom hazir",
         "thumbnail": "Thumbnail",
         "repo": "GitHub repo",
+        "committed": "Commit hazir",
+        "push_queue": "Push sirasinda",
         "push": "GitHub'a yukleniyor",
         "pushed": "Push tamamlandi",
         "pages": "Web sayfasi",
         "pages_configured": "Pages ayarlandi",
+        "pages_queue": "Dogrulama sirasinda",
         "pages_live": "Web dogrulandi",
         "gallery": "Ana galeri",
         "gallery_live": "Galeride gorunuyor",
@@ -1719,6 +4438,7 @@ def launch_gui() -> int:
         "cleanup": "Yerel kopya temizligi",
         "complete": "Tamamlandi",
         "error": "Hata",
+        "stopped": "Durduruldu",
         "gallery_error": "Galeri hatasi",
         "deepzoom_error": "DeepZoom hatasi",
         "complete_error": "Tamamlama hatasi",
@@ -1959,10 +4679,16 @@ def launch_gui() -> int:
             ttk.Button(right, text="Otomatik", command=lambda: self.thumb_var.set("")).grid(row=5, column=2)
             self.thumb_help_var = tk.StringVar(value=f"Otomatik thumbnail: en fazla {THUMB_MAX_PX}px, hedef {THUMB_TARGET_BYTES // 1024} KB JPEG.")
             ttk.Label(right, textvariable=self.thumb_help_var).grid(row=6, column=0, columnspan=3, sticky="w")
+            ttk.Label(right, text="DeepZoom profili:").grid(row=7, column=0, sticky="w", pady=(8, 0))
+            self.profile_var = tk.StringVar(value=DEEPZOOM_PROFILE)
+            self.profile_combo = ttk.Combobox(
+                right, textvariable=self.profile_var, values=list(DEEPZOOM_PROFILES), state="readonly", width=16
+            )
+            self.profile_combo.grid(row=7, column=1, columnspan=2, sticky="e", pady=(8, 0))
             self.save_prep_btn = ttk.Button(right, text="Hazirligi Kaydet", command=self.save_current_preparation)
-            self.save_prep_btn.grid(row=7, column=0, sticky="w", pady=(10, 0))
+            self.save_prep_btn.grid(row=8, column=0, sticky="w", pady=(10, 0))
             self.prep_status_var = tk.StringVar(value="")
-            ttk.Label(right, textvariable=self.prep_status_var).grid(row=7, column=1, columnspan=2, sticky="e", pady=(10, 0))
+            ttk.Label(right, textvariable=self.prep_status_var).grid(row=8, column=1, columnspan=2, sticky="e", pady=(10, 0))
             right.columnconfigure(0, weight=1)
             right.rowconfigure(3, weight=1)
 
@@ -1978,6 +4704,9 @@ def launch_gui() -> int:
             ).pack(side="left")
             self.start_btn = ttk.Button(row, text="Tumunu Yukle", command=self.start_upload, state="disabled")
             self.start_btn.pack(side="right")
+            self.stop_btn = ttk.Button(row, text="Durdur", command=self.stop_upload, state="disabled")
+            self.stop_btn.pack(side="right", padx=(0, 6))
+            self.uploading = False
             self.overall_var = tk.StringVar(value="Klasor taraniyor...")
             ttk.Label(control, textvariable=self.overall_var).pack(anchor="w", pady=(6, 2))
             self.overall_progress = ttk.Progressbar(control, maximum=100, mode="determinate")
@@ -2016,6 +4745,9 @@ def launch_gui() -> int:
             self.rescan_btn.configure(state=normal)
             self.save_prep_btn.configure(state=normal)
             self.start_btn.configure(state="disabled" if busy or not self.jobs else "normal")
+            if not busy:
+                self.uploading = False
+            self.stop_btn.configure(state="normal" if busy and self.uploading else "disabled")
 
         def startup_scan(self) -> None:
             if self.busy:
@@ -2102,6 +4834,7 @@ def launch_gui() -> int:
             self.slide_title_var.set("")
             self.slide_desc.delete("1.0", "end")
             self.thumb_var.set("")
+            self.profile_var.set(DEEPZOOM_PROFILE)
             self.prep_status_var.set("")
 
         def on_tree_select(self, event: Any = None) -> None:
@@ -2118,6 +4851,7 @@ def launch_gui() -> int:
             self.slide_desc.delete("1.0", "end")
             self.slide_desc.insert("1.0", job.description)
             self.thumb_var.set(str(job.thumbnail_source) if job.thumbnail_source else "")
+            self.profile_var.set(job.encoding_profile)
             if job.state.get("gallery_verified") and job.state.get("archived"):
                 self.prep_status_var.set("Tamamlandi")
             else:
@@ -2140,7 +4874,7 @@ def launch_gui() -> int:
                 description = self.slide_desc.get("1.0", "end").strip()
                 thumb_raw = self.thumb_var.get().strip()
                 thumb = Path(thumb_raw) if thumb_raw else None
-                save_job_preparation(job, title, description, thumb)
+                save_job_preparation(job, title, description, thumb, self.profile_var.get() or DEEPZOOM_PROFILE)
                 self.prep_status_var.set("Hazirlik kaydedildi")
                 if self.tree.exists(job.repo_name):
                     self.tree.set(job.repo_name, "status", "Hazir")
@@ -2150,7 +4884,7 @@ def launch_gui() -> int:
                 prepared_count = sum(1 for item in self.jobs if item.prepared)
                 self.overall_var.set(f"{len(self.jobs)} SVS bulundu. {prepared_count}/{len(self.jobs)} hazirlandi.")
                 if not silent:
-                    messagebox.showinfo("Hazirlik", "Baslik, aciklama ve thumbnail tercihi kaydedildi.")
+                    messagebox.showinfo("Hazirlik", "Baslik, aciklama, thumbnail ve DeepZoom profili kaydedildi.")
                 return True
             except Exception as exc:
                 if not silent:
@@ -2182,6 +4916,8 @@ def launch_gui() -> int:
                 f"{len(self.jobs)} slayt yuklenecek. Tum hazirliklar tamam. Baslatilsin mi?",
             ):
                 return
+            DEEPZOOM_CANCEL.clear()
+            self.uploading = True
             self.set_busy(True)
             self.overall_progress["value"] = 2
             self.overall_var.set("Yukleme basladi...")
@@ -2193,6 +4929,18 @@ def launch_gui() -> int:
                 daemon=True,
             ).start()
 
+        def stop_upload(self) -> None:
+            if not self.uploading:
+                return
+            if not messagebox.askyesno(
+                "Durdur",
+                "Suren donusumler durdurulacak ve siradaki slaytlar baslatilmayacak. Yarim kalan slaytlar sonraki calistirmada devam eder. Durdurulsun mu?",
+            ):
+                return
+            self.stop_btn.configure(state="disabled")
+            self.overall_var.set("Durduruluyor; suren yuklemeler bitince toplu islem sonlanacak...")
+            cancel_deepzoom_workers()
+
         def _upload_worker(self, jobs: List[SlideJob], title: str, desc: str, auto_cleanup: bool) -> None:
             try:
                 process_batch(jobs, gallery_title=title, gallery_description=desc, auto_cleanup=auto_cleanup)
@@ -2210,7 +4958,8 @@ def launch_gui() -> int:
         def _cleanup_scan_worker(self) -> None:
             try:
                 skip = {job.repo_name for job in self.jobs}
-                candidates = scan_cleanup_candidates(skip)
+                with background_api_calls():
+                    candidates = scan_cleanup_candidates(skip)
                 self.events.put({"kind": "cleanup_scan_done", "candidates": candidates})
             except Exception as exc:
                 self.events.put({"kind": "cleanup_scan_error", "message": str(exc)})
@@ -2239,7 +4988,8 @@ def launch_gui() -> int:
             skipped: List[str] = []
             for name, path, _ in list(self.cleanup_candidates):
                 try:
-                    safe, reason, size = verify_existing_local_repo_safe(path)
+                    with background_api_calls():
+                        safe, reason, size = verify_existing_local_repo_safe(path, full_sample=True)
                     if safe:
                         safe_rmtree(path)
                         if not path.exists():
@@ -2414,6 +5164,7 @@ def launch_gui() -> int:
                 atomic_write_json(UI_SETTINGS_PATH, {"auto_cleanup": bool(self.auto_cleanup_var.get())})
             except Exception:
                 pass
+            cancel_deepzoom_workers()
             set_event_sink(None)
             self.destroy()
 
@@ -2435,7 +5186,23 @@ def main() -> int:
     parser.add_argument("--check", action="store_true", help="Bagimlilik ve GitHub API kontrolu")
     parser.add_argument("--gallery-only", action="store_true", help="Sadece ana galeriyi senkronize et")
     parser.add_argument("--cli", action="store_true", help="Gorsel arayuz yerine komut satiri akisini calistir")
+    parser.add_argument(
+        "--full-recompute",
+        action="store_true",
+        help="DeepZoom seviyelerini SVS piramidi yerine her zaman tam cozunurlukten uret",
+    )
+    parser.add_argument(
+        "--benchmark-git",
+        type=int,
+        nargs="?",
+        const=10000,
+        metavar="KARO",
+        help="Ornek bir slide_files agacinda git ayar profilinin commit/push suresine etkisini olc",
+    )
     args = parser.parse_args()
+    if args.full_recompute:
+        global NATIVE_PYRAMID
+        NATIVE_PYRAMID = False
 
     try:
         LOGGER.info("Program basladi: %s | dosya=%s | argv=%s", APP_VERSION, Path(__file__).resolve(), sys.argv[1:])
@@ -2445,6 +5212,9 @@ def main() -> int:
         if args.check:
             run_check()
             return 0
+        if args.benchmark_git:
+            benchmark_git_profile(args.benchmark_git)
+            return 0
         if args.gallery_only:
             require_config()
             check_git()